@@ -1,34 +1,204 @@
-import re, sys
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
-
-# Process the input. It's just lines of text.
-input_lines = input_text.split('\n')
+import os, re, sys, mmap
+from collections import deque
+import puzzle_input
+
+# Process the input. It's just lines of text. They stay as bytes, since everything below works on
+# byte values.
+def parse(text) -> list:
+	return [bytes(line) for line in puzzle_input.as_view(text).lines()]
+
+# Both parts are about finding the first and last of a set of strings in each line, so they share
+# an Aho-Corasick automaton. It's built out into a complete state machine: every state has a next
+# state for every possible byte, so scanning is one list lookup per byte, and the states are stored
+# premultiplied by 256 so that the lookup is just table[state + byte]. output[state] is the digit
+# for a state that completes one of the strings, or None.
+#
+# None of the strings contains another one, so the match that ends first also starts first. That
+# means the first match is found by scanning forward until anything matches, and the last match by
+# running a second automaton built from the reversed strings backward from the end of the line.
+# Neither scan goes any further than it has to.
+class Automaton:
+	def __init__(self, patterns: dict):
+		# The trie of the patterns, one dictionary of children per state
+		children = [{}]
+		values = [None]
+		for pattern, value in patterns.items():
+			state = 0
+			for b in pattern:
+				if b not in children[state]:
+					children.append({})
+					values.append(None)
+					children[state][b] = len(children) - 1
+				state = children[state][b]
+			values[state] = value
+
+		# Fill in the missing transitions breadth-first, so that a state's fallback (the longest
+		# suffix of it that's also in the trie) is always done before the state itself
+		self.table = [0] * (256 * len(children))
+		self.output = [None] * (256 * len(children))
+		fallback = [0] * len(children)
+		queue = deque([0])
+		while queue:
+			state = queue.popleft()
+			if values[state] is None:
+				values[state] = values[fallback[state]]
+			self.output[256 * state] = values[state]
+			for b in range(256):
+				child = children[state].get(b)
+				if child is None:
+					self.table[256 * state + b] = self.table[256 * fallback[state] + b] if state != 0 else 0
+				else:
+					fallback[child] = self.table[256 * fallback[state] + b] // 256 if state != 0 else 0
+					self.table[256 * state + b] = 256 * child
+					queue.append(child)
+
+	def first(self, line: bytes) -> int:
+		table = self.table
+		output = self.output
+		state = 0
+		for b in line:
+			state = table[state + b]
+			if output[state] is not None:
+				return output[state]
+		return None
+
+# The forward automaton finds first matches, and the reversed one finds last matches
+def make_automata(patterns: dict) -> tuple:
+	return Automaton(patterns), Automaton({pattern[::-1]: value for pattern, value in patterns.items()})
+
+# Lines without any digits don't have a calibration value
+def calibration_sum(input_lines: list, automata: tuple) -> int:
+	forward, backward = automata
+	total = 0
+	for line in input_lines:
+		first = forward.first(line)
+		if first is not None:
+			total += 10 * first + backward.first(reversed(line))
+	return total
 
 # Part 1: What is the sum of all of the calibration values? The calibration value for a line
 # is the combination of the first and last numerical digit in the line. Note that there may only be
 # one digit!
-input_line_digits = [re.findall(r'\d', line) for line in input_lines]
-calibration_values = [int(digits[0] + digits[-1]) for digits in input_line_digits if len(digits) >= 1]
-print(f"Part 1: The sum of the calibration values is: {sum(calibration_values)}")
+digit_patterns = {str(d).encode(): d for d in range(10)}
+digit_automata = make_automata(digit_patterns)
+
+def part1(input_lines: list) -> int:
+	return calibration_sum(input_lines, digit_automata)
+
+# This was the original solution, which verify.py checks the automaton against
+def reference_part1(input_lines: list) -> int:
+	input_line_digits = [re.findall(rb'\d', line) for line in input_lines]
+	calibration_values = [int(digits[0] + digits[-1]) for digits in input_line_digits if len(digits) >= 1]
+	return sum(calibration_values)
 
 # Part 2: In addition to numerical digits, we can now have numbers spelled out ("one", "two", etc.).
 # What is the sum of the calibration values now? Since a spelled-out number will never contain a digit,
 # we can tokenize the lines into digits and strings of letters. Tokenization is done via REs using a
 # modified method from: https://stackoverflow.com/a/70979561/5220760
-number_match = r'(?=(\d|zero|one|two|three|four|five|six|seven|eight|nine))'
-input_line_numbers = [re.findall(number_match, line) for line in input_lines]
+# The automaton just gets the words as well as the digits.
+number_match = rb'(?=(\d|zero|one|two|three|four|five|six|seven|eight|nine))'
+number_lookup = {b'zero': b'0', b'one': b'1', b'two': b'2', b'three': b'3', b'four': b'4', b'five': b'5', b'six': b'6', b'seven': b'7', b'eight': b'8', b'nine': b'9'}
+number_patterns = digit_patterns | {word: int(digit) for word, digit in number_lookup.items()}
+number_automata = make_automata(number_patterns)
+
+def part2(input_lines: list) -> int:
+	return calibration_sum(input_lines, number_automata)
+
+def reference_part2(input_lines: list) -> int:
+	input_line_numbers = [re.findall(number_match, line) for line in input_lines]
+	calibration_strings = [number_lookup.get(numbers[0], numbers[0]) + number_lookup.get(numbers[-1], numbers[-1]) for numbers in input_line_numbers]
+	calibration_values = [int(cal_str) for cal_str in calibration_strings]
+	return sum(calibration_values)
+
+# For calibration documents too big to load, the sums can be worked out in one pass over a file in
+# fixed-size chunks. There's no going backward here, so the last match is just the most recent one.
+# The automaton state carries straight over from one chunk to the next, so a line split between
+# chunks doesn't need any special handling. The first chunk has to start at the start of a line.
+def stream_sums(chunks, automata: list) -> list:
+	tables = [forward.table for forward, _ in automata]
+	outputs = [forward.output for forward, _ in automata]
+	totals = [0] * len(automata)
+	states = [0] * len(automata)
+	firsts = [None] * len(automata)
+	lasts = [None] * len(automata)
+	for chunk in chunks:
+		for n in range(len(automata)):
+			table = tables[n]
+			output = outputs[n]
+			state = states[n]
+			first = firsts[n]
+			last = lasts[n]
+			for b in chunk:
+				if b == 10:
+					if first is not None:
+						totals[n] += 10 * first + last
+						first = None
+					state = 0
+				else:
+					state = table[state + b]
+					value = output[state]
+					if value is not None:
+						if first is None:
+							first = value
+						last = value
+			states[n] = state
+			firsts[n] = first
+			lasts[n] = last
+	for n in range(len(automata)):
+		if firsts[n] is not None:
+			totals[n] += 10 * firsts[n] + lasts[n]
+	return totals
+
+stream_chunk_size = 1 << 20
+
+# Bigger files are split into byte ranges that each start just after a newline, and a pool of
+# worker processes sums the ranges of a memory-mapped copy of the file. Lines never cross a range
+# boundary, so the partial sums just add up. There are a few ranges per worker so that one slow
+# range doesn't hold up the rest.
+ranges_per_job = 4
+
+def line_ranges(buffer, num_ranges: int) -> list:
+	size = len(buffer)
+	starts = [0]
+	for n in range(1, num_ranges):
+		newline = buffer.find(b'\n', max(starts[-1], size * n // num_ranges))
+		if newline == -1 or newline + 1 == size:
+			break
+		starts.append(newline + 1)
+	return [(starts[n], starts[n+1] if n + 1 < len(starts) else size) for n in range(len(starts))]
+
+def sum_range(job: tuple) -> list:
+	path, start, end = job
+	with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+		chunks = (buffer[c:min(c + stream_chunk_size, end)] for c in range(start, end, stream_chunk_size))
+		return stream_sums(chunks, [digit_automata, number_automata])
+
+def parallel_sums(path: str, jobs: int) -> list:
+	if os.path.getsize(path) == 0:
+		return [0, 0]
+	with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+		ranges = line_ranges(buffer, jobs * ranges_per_job)
+	if jobs <= 1 or len(ranges) == 1:
+		return sum_range((path, 0, ranges[-1][1]))
+
+	# Only the streaming mode needs this, so the normal runs don't pay for importing it
+	import multiprocessing
+	totals = [0, 0]
+	with multiprocessing.Pool(processes=jobs) as pool:
+		for sums in pool.imap_unordered(sum_range, [(path, start, end) for start, end in ranges]):
+			totals = [t + s for t, s in zip(totals, sums)]
+	return totals
+
+if __name__ == '__main__':
+	# python Day1.py --stream calibration.txt [--jobs 8]
+	if '--stream' in sys.argv:
+		path = sys.argv[sys.argv.index('--stream') + 1]
+		jobs = int(sys.argv[sys.argv.index('--jobs') + 1]) if '--jobs' in sys.argv else os.cpu_count() or 1
+		sum1, sum2 = parallel_sums(path, jobs)
+		print(f"Part 1: The sum of the calibration values is: {sum1}")
+		print(f"Part 2: The sum of the calibration values is: {sum2}")
+		sys.exit(0)
 
-number_lookup = {'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9'}
-calibration_strings = [number_lookup.get(numbers[0], numbers[0]) + number_lookup.get(numbers[-1], numbers[-1]) for numbers in input_line_numbers]
-calibration_values = [int(cal_str) for cal_str in calibration_strings]
-print(f"Part 2: The sum of the calibration values is: {sum(calibration_values)}")
+	input_lines = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The sum of the calibration values is: {part1(input_lines)}")
+	print(f"Part 2: The sum of the calibration values is: {part2(input_lines)}")
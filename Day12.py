@@ -1,22 +1,14 @@
-import re, sys, copy
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import copy
+import puzzle_input
 
 # Process the input. Each line consists of A) a sequence of characters representing springs that
 # are operational ('.'), damaged ('#'), or in an unknown state ('?'); and B) a list of numbers
 # giving the size of each contiguous group of damaged springs.
-input_lines = input_text.split('\n')
-records = [line.split(' ')[0] for line in input_lines]
-group_sizes = [[int(n) for n in line.split(' ')[1].split(',')] for line in input_lines]
+def parse(text) -> tuple:
+	input_lines = puzzle_input.as_view(text).text_lines()
+	records = [line.split(' ')[0] for line in input_lines]
+	group_sizes = [[int(n) for n in line.split(' ')[1].split(',')] for line in input_lines]
+	return records, group_sizes
 
 # Part 1: For each record, find the number of possible arrangements of damaged springs that could
 # produce the given group sizes. What is the sum of those counts? It looks like there aren't any
@@ -45,8 +37,11 @@ def count_valid_combinations(record: str, groups: list):
 			num_valid_combos += 1
 	return num_valid_combos
 
-#total_valid_combos = sum(count_valid_combinations(records[n], group_sizes[n]) for n in range(len(records)))
-#print(f"Part 1: The total count of valid arrangements is: {total_valid_combos}")
+# The brute force is too slow for the real input now that there's a faster way (see below), but it's
+# still the reference that verify.py checks part 1 against on small inputs
+def reference_part1(springs: tuple) -> int:
+	records, group_sizes = springs
+	return sum(count_valid_combinations(records[n], group_sizes[n]) for n in range(len(records)))
 
 # Part 2: Replace each record and group size list with five concatenated copies of itself. Yeah,
 # I had a feeling... Well, there's no way we're going to iterate over 60 bits of possibilities, so
@@ -54,9 +49,8 @@ def count_valid_combinations(record: str, groups: list):
 # where we handle one group of ?s at a time? Still a lot, but at least it maxes out a millions of
 # combinations instead of billions. The internet suggests using the size of the gaps between the
 # groups as a variable. Let's try a recursive solution using that. Turns out I need memorization
-# (I refuse to call it "memoization") to get usable performance.
-memo = {}
-def count_valid_combos(rem_rec: str, rem_groups: tuple, depth: int):
+# (I refuse to call it "memoization") to get usable performance. Each part starts its own memo.
+def count_valid_combos(rem_rec: str, rem_groups: tuple, depth: int, memo: dict):
 	key = (rem_rec, rem_groups, depth)
 	if key in memo:
 		return memo[key]
@@ -75,20 +69,31 @@ def count_valid_combos(rem_rec: str, rem_groups: tuple, depth: int):
 			gap_rec = rem_rec[gap:]
 			doable = len(gap_rec) >= rem_groups[0] and '.' not in gap_rec[:rem_groups[0]]
 			if doable:
-				valid_combos += count_valid_combos(gap_rec[rem_groups[0]:], rem_groups[1:], depth + 1)
+				valid_combos += count_valid_combos(gap_rec[rem_groups[0]:], rem_groups[1:], depth + 1, memo)
 		memo[key] = valid_combos
 		return valid_combos
 
 # Might as well redo part 1 here; it runs much faster
-total_valid_combos = 0
-for n in range(len(records)):
-	total_valid_combos += count_valid_combos(records[n], tuple(group_sizes[n]), 0)
-print(f"Part 1: The total count of valid arrangements is: {total_valid_combos}")
+def part1(springs: tuple) -> int:
+	records, group_sizes = springs
+	memo = {}
+	total_valid_combos = 0
+	for n in range(len(records)):
+		total_valid_combos += count_valid_combos(records[n], tuple(group_sizes[n]), 0, memo)
+	return total_valid_combos
 
 # Let's finish this off. Takes about 3 seconds to run.
-total_valid_combos = 0
-for n in range(len(records)):
-	new_record = records[n] + '?' + records[n] + '?' + records[n] + '?' + records[n] + '?' + records[n]
-	new_group_sizes = group_sizes[n] * 5
-	total_valid_combos += count_valid_combos(new_record, tuple(new_group_sizes), 0)
-print(f"Part 2: The total count of valid arrangements is: {total_valid_combos}")
+def part2(springs: tuple) -> int:
+	records, group_sizes = springs
+	memo = {}
+	total_valid_combos = 0
+	for n in range(len(records)):
+		new_record = records[n] + '?' + records[n] + '?' + records[n] + '?' + records[n] + '?' + records[n]
+		new_group_sizes = group_sizes[n] * 5
+		total_valid_combos += count_valid_combos(new_record, tuple(new_group_sizes), 0, memo)
+	return total_valid_combos
+
+if __name__ == '__main__':
+	springs = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The total count of valid arrangements is: {part1(springs)}")
+	print(f"Part 2: The total count of valid arrangements is: {part2(springs)}")
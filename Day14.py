@@ -1,102 +1,97 @@
-import re, sys, copy
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import puzzle_input
+from grid import Grid
 
 # Process the input. It's (sigh) another 2-D grid. The grid consists of empty space ('.'), cube-
-# shaped rocks ('#', and rounded rocks ('O'). We're going to have to move rocks around, so let's
-# same some time and convert the strings to lists right away.
-grid = [list(line) for line in input_text.split('\n')]
-y_size = len(grid)
-x_size = len(grid[0])
+# shaped rocks ('#', and rounded rocks ('O'). We're going to have to move rocks around, so it goes
+# in a flat, mutable grid (see grid.py).
+def parse(text) -> Grid:
+	return Grid(puzzle_input.as_view(text).text_lines())
+
+ROUND = ord('O')
+CUBE = ord('#')
+EMPTY = ord('.')
 
-def print_grid(grid: list):
-	print('\n' + '\n'.join(''.join(g) for g in grid))
+def print_grid(grid: Grid):
+	print('\n' + str(grid))
 
 # Part 1: Tilt the platform so that all rounded rocks roll north (towards y=0). Find the total load
 # on the support beams by calculating the distance from the bottom, with the bottommost row being 1.
-def roll_rocks_north(grid: list):
-	for x in range(x_size):
-		northmost = 0
-		for y in range(y_size):
-			if grid[y][x] == '#':
-				northmost = y + 1
-			elif grid[y][x] == 'O':
-				if y != northmost:
-					grid[northmost][x] = 'O'
-					grid[y][x] = '.'
-				northmost += 1
+# All four directions work the same way: walk each line away from the wall the rocks roll towards,
+# keeping track of the nearest free spot. Each line starts at an index against that wall and moves
+# by step, which is one of the grid's direction offsets.
+def roll_rocks(grid: Grid, starts: range, step: int, length: int):
+	cells = grid.cells
+	for start in starts:
+		free = start
+		i = start
+		for _ in range(length):
+			c = cells[i]
+			if c == CUBE:
+				free = i + step
+			elif c == ROUND:
+				if i != free:
+					cells[free] = ROUND
+					cells[i] = EMPTY
+				free += step
+			i += step
 
-def calculate_load(grid: list):
+def roll_rocks_north(grid: Grid):
+	roll_rocks(grid, range(grid.index(0, 0), grid.index(grid.x_size, 0)), grid.down, grid.y_size)
+
+def calculate_load(grid: Grid):
 	load = 0
-	for y in range(y_size):
-		for x in range(x_size):
-			if grid[y][x] == 'O':
-				load += y_size - y
+	for y in range(grid.y_size):
+		start = grid.index(0, y)
+		load += grid.cells.count(ROUND, start, start + grid.x_size) * (grid.y_size - y)
 	return load
 
-part1_grid = copy.deepcopy(grid)
-roll_rocks_north(part1_grid)
-load = calculate_load(part1_grid)
-print(f"Part 1: The total load is: {load}")
+def part1(grid: Grid) -> int:
+	part1_grid = grid.copy()
+	roll_rocks_north(part1_grid)
+	return calculate_load(part1_grid)
 
 # Part 2: A spin cycle involves tilting the platform north, then west, then south, then east. What
 # is the total load after a billion cycles? I'm guessing there's going to be a repeating pattern.
-def roll_rocks_south(grid: list):
-	for x in range(x_size):
-		southmost = y_size - 1
-		for y in range(y_size - 1, -1, -1):
-			if grid[y][x] == '#':
-				southmost = y - 1
-			elif grid[y][x] == 'O':
-				if y != southmost:
-					grid[southmost][x] = 'O'
-					grid[y][x] = '.'
-				southmost -= 1
+def roll_rocks_south(grid: Grid):
+	roll_rocks(grid, range(grid.index(0, grid.y_size - 1), grid.index(grid.x_size, grid.y_size - 1)), grid.up, grid.y_size)
+
+def roll_rocks_west(grid: Grid):
+	roll_rocks(grid, range(grid.index(0, 0), grid.index(0, grid.y_size), grid.stride), grid.right, grid.x_size)
 
-def roll_rocks_west(grid: list):
-	for y in range(y_size):
-		westmost = 0
-		for x in range(x_size):
-			if grid[y][x] == '#':
-				westmost = x + 1
-			elif grid[y][x] == 'O':
-				if x != westmost:
-					grid[y][westmost] = 'O'
-					grid[y][x] = '.'
-				westmost += 1
+def roll_rocks_east(grid: Grid):
+	roll_rocks(grid, range(grid.index(grid.x_size - 1, 0), grid.index(grid.x_size - 1, grid.y_size), grid.stride), grid.left, grid.x_size)
 
-def roll_rocks_east(grid: list):
-	for y in range(y_size):
-		eastmost = x_size - 1
-		for x in range(x_size - 1, -1, -1):
-			if grid[y][x] == '#':
-				eastmost = x - 1
-			elif grid[y][x] == 'O':
-				if x != eastmost:
-					grid[y][eastmost] = 'O'
-					grid[y][x] = '.'
-				eastmost -= 1
+def spin_cycle(grid: Grid):
+	roll_rocks_north(grid)
+	roll_rocks_west(grid)
+	roll_rocks_south(grid)
+	roll_rocks_east(grid)
 
-part2_grid = copy.deepcopy(grid)
-for cycle in range(300):
-	roll_rocks_north(part2_grid)
-	roll_rocks_west(part2_grid)
-	roll_rocks_south(part2_grid)
-	roll_rocks_east(part2_grid)
-	print(f"Cycle {cycle}: {calculate_load(part2_grid)}")
+# I originally solved this part by printing the load for the first 300 cycles, using grep to find
+# the pattern period, and doing a quick calculation in Excel of where in the pattern I needed to
+# look. The answer was 93742: the repeating value 93827 has a period of 51 cycles, and via
+# arithmetic the same value appears on cycle 999,999,960, which is 39 cycles before the end
+# (counting from zero). 93742 is the value that appears 39 cycles after 93827.
+#
+# Doing the same thing in code: the whole grid fits in one bytearray, so we can remember every grid
+# we've seen. The first time one comes back, we know where the loop starts and how long it is, and
+# the grid after the last cycle is the one at the same position in the loop.
+def part2(grid: Grid, num_cycles: int = 1000000000) -> int:
+	part2_grid = grid.copy()
+	seen = {}
+	loads = []
+	for cycle in range(num_cycles):
+		state = bytes(part2_grid.cells)
+		if state in seen:
+			loop_start = seen[state]
+			period = cycle - loop_start
+			return loads[loop_start + (num_cycles - loop_start) % period]
+		seen[state] = cycle
+		loads.append(calculate_load(part2_grid))
+		spin_cycle(part2_grid)
+	return calculate_load(part2_grid)
 
-# I solved this part by running until I saw a repeating pattern, then using grep to find the pattern
-# period and Excel to do a quick calculation of where in the pattern I needed to look to find the
-# answer. Turns out the answer is 93742. I got this by looking at the repeating value 93827, which
-# has a period of 51 cycles. Via arithmetic, the same value appears on cycle 999,999,960, which is
-# 39 cycles before the end (counting from zero). 93742 is the value that appears 39 cycles after
-# 93827, so that's the answer.
+if __name__ == '__main__':
+	grid = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The total load is: {part1(grid)}")
+	print(f"Part 2: The total load after a billion spin cycles is: {part2(grid)}")
@@ -1,91 +1,93 @@
-import re, sys, copy
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import puzzle_input
+from grid import Grid
 
 # Process the input. It's a 2-D grid consisting of mirrors ('/' and '\'), splitter ('|' and '-'),
-# and empty space ('.').
-grid = [list(line) for line in input_text.split('\n')]
-y_size = len(grid)
-x_size = len(grid[0])
+# and empty space ('.'). It goes in a flat grid (see grid.py) whose blank border tells a beam that
+# it has left the grid, and directions are the grid's index offsets.
+def parse(text) -> Grid:
+	return Grid(puzzle_input.as_view(text).text_lines())
 
-def print_grid(grid: list):
-	print('\n' + '\n'.join(''.join(g) for g in grid))
+def print_grid(grid: Grid):
+	print('\n' + str(grid))
 
 # Part 1: Light reflects off of mirrors at a 90-degree angle, and is split into two 90-degree beams
 # when it hits a splitter perpendicularly. How many tiles have a beam of light passing through them
 # ("energized")?
-def print_energized(tiles: list):
+def print_energized(grid: Grid, tiles: bytearray):
 	out = []
-	for y in range(y_size):
-		out.append([])
-		for x in range(x_size):
-			out[y].append('#' if tiles[y][x] else '.')
-	print('\n' + '\n'.join(''.join(g) for g in out))
+	for y in range(grid.y_size):
+		out.append(''.join('#' if tiles[grid.index(x, y)] else '.' for x in range(grid.x_size)))
+	print('\n' + '\n'.join(out))
+
+SLASH = ord('/')
+BACKSLASH = ord('\\')
+VERTICAL = ord('|')
+HORIZONTAL = ord('-')
+
+# An unexpected bit of trickiness -- the light can travel in loops, including back through a
+# splitter lengthwise! A beam that gets to a cell going in a direction that some beam has already
+# gone through it in can stop, since everything after that has been seen already. Each cell gets a
+# bit per direction in seen, and any cell with a bit set is energized. Split beams go on a stack
+# rather than being followed recursively, since big grids can split deep enough to hit the
+# recursion limit.
+def follow_light_beam(grid: Grid, i: int, direction: int, seen: bytearray):
+	# The new direction after hitting each kind of mirror
+	slash_turns = {grid.right: grid.up, grid.left: grid.down, grid.up: grid.right, grid.down: grid.left}
+	backslash_turns = {grid.right: grid.down, grid.left: grid.up, grid.up: grid.left, grid.down: grid.right}
+	direction_bits = {grid.up: 1, grid.down: 2, grid.left: 4, grid.right: 8}
+	cells = grid.cells
+	border = grid.border
+	beams = [(i, direction)]
+	while beams:
+		i, direction = beams.pop()
+		while True:
+			tile = cells[i]
+			bit = direction_bits[direction]
+			if tile == border or seen[i] & bit:
+				break
 
-# An unexpected bit of trickiness -- the light can travel in loops! We need to mark which splitters
-# have been used already.
-def follow_light_beam(x: int, y: int, direction: tuple, energized: list, splitter_used: list):
-	while True:
-		if x < 0 or x >= x_size or y < 0 or y >= y_size:
-			break
+			seen[i] |= bit
+			if tile == SLASH:
+				direction = slash_turns[direction]
+			elif tile == BACKSLASH:
+				direction = backslash_turns[direction]
+			elif tile == VERTICAL and (direction == grid.right or direction == grid.left):
+				beams.append((i + grid.down, grid.down))
+				beams.append((i + grid.up, grid.up))
+				break
+			elif tile == HORIZONTAL and (direction == grid.down or direction == grid.up):
+				beams.append((i + grid.right, grid.right))
+				beams.append((i + grid.left, grid.left))
+				break
+			
+			i += direction
 
-		energized[y][x] = True
-		tile = grid[y][x]
-		if tile == '/':
-			direction = (-direction[1], -direction[0])
-		elif tile == '\\':
-			direction = (direction[1], direction[0])
-		elif tile == '|' and (direction == (1, 0) or direction == (-1, 0)):
-			if not splitter_used[y][x]:
-				splitter_used[y][x] = True
-				follow_light_beam(x, y - 1, (0, -1), energized, splitter_used)
-				follow_light_beam(x, y + 1, (0, 1), energized, splitter_used)
-			break
-		elif tile == '-' and (direction == (0, 1) or direction == (0, -1)):
-			if not splitter_used[y][x]:
-				splitter_used[y][x] = True
-				follow_light_beam(x - 1, y, (-1, 0), energized, splitter_used)
-				follow_light_beam(x + 1, y, (1, 0), energized, splitter_used)
-			break
-		
-		x += direction[0]
-		y += direction[1]
+def run_one_configuration(grid: Grid, x: int, y: int, direction: int):
+	seen = bytearray(len(grid))
+	follow_light_beam(grid, grid.index(x, y), direction, seen)
+	return len(seen) - seen.count(0)
 
-energized_tiles = [[False for x in range(x_size)] for y in range(y_size)]
-splitter_used = [[False for x in range(x_size)] for y in range(y_size)]
-follow_light_beam(0, 0, (1, 0), energized_tiles, splitter_used)
-num_energized = sum(energized_tiles[y][x] for y in range(y_size) for x in range(x_size))
-print(f"Part 1: The number of energized tiles is: {num_energized}")
+def part1(grid: Grid) -> int:
+	return run_one_configuration(grid, 0, 0, grid.right)
 
 # Part 2: We can make the light enter from any location on any edge. For the choice that produces
 # the most energized tiles, how many tiles are energized?
-def run_one_configuration(x: int, y: int, direction: tuple):
-	energized_tiles = [[False for x in range(x_size)] for y in range(y_size)]
-	splitter_used = [[False for x in range(x_size)] for y in range(y_size)]
-	follow_light_beam(x, y, direction, energized_tiles, splitter_used)
-	num_energized = sum(energized_tiles[y][x] for y in range(y_size) for x in range(x_size))
-	return num_energized
+def part2(grid: Grid) -> int:
+	max_energized = 0
+	for x in range(grid.x_size):
+		energized = run_one_configuration(grid, x, 0, grid.down)
+		max_energized = max(max_energized, energized)
+		energized = run_one_configuration(grid, x, grid.y_size - 1, grid.up)
+		max_energized = max(max_energized, energized)
 
-max_energized = 0
-for x in range(x_size):
-	energized = run_one_configuration(x, 0, (0, 1))
-	max_energized = max(max_energized, energized)
-	energized = run_one_configuration(x, y_size - 1, (0, -1))
-	max_energized = max(max_energized, energized)
+	for y in range(grid.y_size):
+		energized = run_one_configuration(grid, 0, y, grid.right)
+		max_energized = max(max_energized, energized)
+		energized = run_one_configuration(grid, grid.x_size - 1, y, grid.left)
+		max_energized = max(max_energized, energized)
+	return max_energized
 
-for y in range(y_size):
-	energized = run_one_configuration(0, y, (1, 0))
-	max_energized = max(max_energized, energized)
-	energized = run_one_configuration(x_size - 1, y, (-1, 0))
-	max_energized = max(max_energized, energized)
-	
-print(f"Part 2: The maximum possible number of energized tiles is: {max_energized}")
+if __name__ == '__main__':
+	grid = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The number of energized tiles is: {part1(grid)}")
+	print(f"Part 2: The maximum possible number of energized tiles is: {part2(grid)}")
@@ -1,49 +1,43 @@
-import re, sys, copy
+import re, copy
 from collections import namedtuple
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import puzzle_input
 
 # Process the input. We have a collection of "workflows" (instructions for routing parts) and a
 # collection of part ratings. Each part is rated in four categories, "x", "m", "a", and "s".
-(workflow_lines, ratings_lines) = (t.split('\n') for t in input_text.split('\n\n'))
-
 Rating = namedtuple('Rating', ['x', 'm', 'a', 's'])
-ratings = []
-for line in ratings_lines:
-	m = re.match(r'{x=(\d+),m=(\d+),a=(\d+),s=(\d+)}', line)
-	ratings.append(Rating(int(m[1]), int(m[2]), int(m[3]), int(m[4])))
+
+def parse(text) -> tuple:
+	(workflow_lines, ratings_lines) = (block.text_lines() for block in puzzle_input.as_view(text).blocks())
+	ratings = []
+	for line in ratings_lines:
+		m = re.match(r'{x=(\d+),m=(\d+),a=(\d+),s=(\d+)}', line)
+		ratings.append(Rating(int(m[1]), int(m[2]), int(m[3]), int(m[4])))
+	return workflow_lines, ratings
 
 # Just for fun, let's use functional programming!
-workflows = {}
-for line in workflow_lines:
-	bkt = line.index('{')
-	name = line[:bkt]
-	instructions = line[bkt+1:-1].split(',')
-	inst_funcs = []
-	for inst in instructions[:-1]:
-		stat = inst[0]
-		oper = inst[1]
-		level = int(re.findall(r'\d+', inst)[0])
-		target = inst[inst.index(':')+1:]
+def make_workflow_functions(workflow_lines: list) -> dict:
+	workflows = {}
+	for line in workflow_lines:
+		bkt = line.index('{')
+		name = line[:bkt]
+		instructions = line[bkt+1:-1].split(',')
+		inst_funcs = []
+		for inst in instructions[:-1]:
+			stat = inst[0]
+			oper = inst[1]
+			level = int(re.findall(r'\d+', inst)[0])
+			target = inst[inst.index(':')+1:]
 		
-		# Turns out Python is really picky about the way it captures values for closures. To avoid
-		# overwriting values used by existing lambdas, we need to create extra parameters with
-		# default values and bind our values to those defaults. Yeesh.
-		if oper == '<':
-			inst_funcs.append(lambda rating, target=target, stat=stat, level=level: target if rating.__getattribute__(stat) < level else None)
-		elif oper == '>':
-			inst_funcs.append(lambda rating, target=target, stat=stat, level=level: target if rating.__getattribute__(stat) > level else None)
-	inst_funcs.append(lambda rating, target=instructions[-1]: target)
-	workflows[name] = inst_funcs
+			# Turns out Python is really picky about the way it captures values for closures. To avoid
+			# overwriting values used by existing lambdas, we need to create extra parameters with
+			# default values and bind our values to those defaults. Yeesh.
+			if oper == '<':
+				inst_funcs.append(lambda rating, target=target, stat=stat, level=level: target if rating.__getattribute__(stat) < level else None)
+			elif oper == '>':
+				inst_funcs.append(lambda rating, target=target, stat=stat, level=level: target if rating.__getattribute__(stat) > level else None)
+		inst_funcs.append(lambda rating, target=instructions[-1]: target)
+		workflows[name] = inst_funcs
+	return workflows
 
 # Part 1: Run each part through the workflows until it is either accepted or rejected. What is the
 # sum of the ratings of all of the accepted parts?
@@ -57,34 +51,39 @@ def do_workflow(workflow: list, rating: Rating):
 def score(rating: Rating):
 	return rating.x + rating.m + rating.a + rating.s
 
-sum_scores = 0
-for rating in ratings:
-	wf = 'in'
-	while wf != 'A' and wf != 'R':
-		wf = do_workflow(workflows[wf], rating)
-	if wf == 'A':
-		sum_scores += score(rating)
-print(f"Part 1: The sum of the ratings of the accepted parts is: {sum_scores}")
+def part1(system: tuple) -> int:
+	workflow_lines, ratings = system
+	workflows = make_workflow_functions(workflow_lines)
+	sum_scores = 0
+	for rating in ratings:
+		wf = 'in'
+		while wf != 'A' and wf != 'R':
+			wf = do_workflow(workflows[wf], rating)
+		if wf == 'A':
+			sum_scores += score(rating)
+	return sum_scores
 
 # Part 2: Forget the part list. Each of the four ratings can have a value between 1 and 4000. How
 # many combinations of ratings will be accepted? Sheesh, I was hoping for an easy puzzle today...
 # Time for some recursion! We'll need to reprocess the rules, too, since the functional approach is
 # (not unexpectedly) entirely wrong for this part.
 Rule = namedtuple('Rule', ['stat', 'oper', 'level', 'target'])
-workflows: dict[str, Rule] = {}
-for line in workflow_lines:
-	bkt = line.index('{')
-	name = line[:bkt]
-	instructions = line[bkt+1:-1].split(',')
-	inst_rules = []
-	for inst in instructions[:-1]:
-		stat = inst[0]
-		oper = inst[1]
-		level = int(re.findall(r'\d+', inst)[0])
-		target = inst[inst.index(':')+1:]
-		inst_rules.append(Rule(stat, oper, level, target))
-	inst_rules.append(Rule('', 'default', '', instructions[-1]))
-	workflows[name] = inst_rules
+def make_workflow_rules(workflow_lines: list) -> dict:
+	workflows: dict[str, Rule] = {}
+	for line in workflow_lines:
+		bkt = line.index('{')
+		name = line[:bkt]
+		instructions = line[bkt+1:-1].split(',')
+		inst_rules = []
+		for inst in instructions[:-1]:
+			stat = inst[0]
+			oper = inst[1]
+			level = int(re.findall(r'\d+', inst)[0])
+			target = inst[inst.index(':')+1:]
+			inst_rules.append(Rule(stat, oper, level, target))
+		inst_rules.append(Rule('', 'default', '', instructions[-1]))
+		workflows[name] = inst_rules
+	return workflows
 
 # Each rule affects one stat and only ever shrinks its range (i.e. never splits it into two ranges).
 # This makes the ranges fairly easy to represent.
@@ -120,7 +119,7 @@ def update_ranges(stat: str, new_range: Range, ranges: Ranges):
 		a = ranges.a if stat != 'a' else new_range,
 		s = ranges.s if stat != 's' else new_range)
 
-def count_valid_combos(workflow: str, ranges: Ranges):
+def count_valid_combos(workflows: dict, workflow: str, ranges: Ranges):
 	if workflow == 'A':
 		return ranges_combos(ranges)
 	elif workflow == 'R':
@@ -129,18 +128,25 @@ def count_valid_combos(workflow: str, ranges: Ranges):
 		valid_combos = 0
 		for rule in workflows[workflow]:
 			if rule.oper == 'default':
-				valid_combos += count_valid_combos(rule.target, ranges)
+				valid_combos += count_valid_combos(workflows, rule.target, ranges)
 			else:
 				stat_range = ranges.__getattribute__(rule.stat)
 				in_range, out_range = split_range(stat_range, rule.oper, rule.level)
 				if in_range is not None:
-					valid_combos += count_valid_combos(rule.target, update_ranges(rule.stat, in_range, ranges))
+					valid_combos += count_valid_combos(workflows, rule.target, update_ranges(rule.stat, in_range, ranges))
 				if out_range is None:
 					break
 				else:
 					ranges = update_ranges(rule.stat, out_range, ranges)
 		return valid_combos
 
-start_ranges = Ranges(Range(1, 4000), Range(1, 4000), Range(1, 4000), Range(1, 4000))
-num_valid_combos = count_valid_combos('in', start_ranges)
-print(f"Part 2: The number of accepted rating combinations is: {num_valid_combos}")
+def part2(system: tuple) -> int:
+	workflow_lines, ratings = system
+	start_ranges = Ranges(Range(1, 4000), Range(1, 4000), Range(1, 4000), Range(1, 4000))
+	return count_valid_combos(make_workflow_rules(workflow_lines), 'in', start_ranges)
+
+if __name__ == '__main__':
+	system = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The sum of the ratings of the accepted parts is: {part1(system)}")
+	print(f"Part 2: The number of accepted rating combinations is: {part2(system)}")
+
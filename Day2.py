@@ -1,56 +1,58 @@
-import re, sys
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+from array import array
+from operator import mul
+import puzzle_input
 
 # Process the input. Each line is a single numbered game consisting of multiple sets of colored
 # cube quantities delimited by commas (for the quantities) and semicolons (for the sets).
-def round_text_to_tuple(round_text: str):
-	red_match = re.search(r'(\d+) red', round_text)
-	red = int(red_match[1]) if red_match else 0
-	green_match = re.search(r'(\d+) green', round_text)
-	green = int(green_match[1]) if green_match else 0
-	blue_match = re.search(r'(\d+) blue', round_text)
-	blue = int(blue_match[1]) if blue_match else 0
-	return (red, green, blue)
+# Both parts only ever care about the most cubes of each color seen in a game, so that's all that
+# gets kept: one column per color with an entry per game, filled in as the lines are read. Without
+# the punctuation, a game is just alternating counts and colors, and the first letter of the color
+# is enough to tell them apart.
+class Games:
+	def __init__(self):
+		self.ids = array('I')
+		self.red = array('H')
+		self.green = array('H')
+		self.blue = array('H')
 
+	def __len__(self) -> int:
+		return len(self.ids)
 
-input_lines = input_text.split('\n')
-games = []
-for line in input_lines:
-	rounds_text = line.split(':')[1].split('; ')
-	rounds = [round_text_to_tuple(round) for round in rounds_text]
-	games.append(rounds)
+def parse(text) -> Games:
+	games = Games()
+	for line in puzzle_input.as_view(text).text_lines():
+		game_text, _, rounds_text = line.partition(': ')
+		tokens = rounds_text.replace(',', '').replace(';', '').split()
+		most = {'r': 0, 'g': 0, 'b': 0}
+		for n in range(0, len(tokens), 2):
+			count = int(tokens[n])
+			color = tokens[n+1][0]
+			if count > most[color]:
+				most[color] = count
+		games.ids.append(int(game_text[5:]))
+		games.red.append(most['r'])
+		games.green.append(most['g'])
+		games.blue.append(most['b'])
+	return games
 
 # Part 1: Which games would have been possible if the bag had been loaded with only 12 red cubes,
-# 13 green cubes, and 14 blue cubes? What is the sum of the ID numbers of those games?
-sum_ids = 0
-for n in range(len(games)):
-	fail = False
-	for round in games[n]:
-		if round[0] > 12 or round[1] > 13 or round[2] > 14:
-			fail = True
-	if not fail:
-		sum_ids += n + 1
-print(f"Part 1: The sum of the IDs of the valid games is: {sum_ids}")
+# 13 green cubes, and 14 blue cubes? What is the sum of the ID numbers of those games? A game is
+# possible if its maximums all fit, and any other bag can be asked about the same way.
+def possible_id_sum(games: Games, red: int, green: int, blue: int) -> int:
+	return sum(id for id, r, g, b in zip(games.ids, games.red, games.green, games.blue)
+	           if r <= red and g <= green and b <= blue)
+
+def part1(games: Games) -> int:
+	return possible_id_sum(games, 12, 13, 14)
 
 # Part 2: What is the fewest number of cubes of each color that could have produced each game?
 # If the "power" of a set of cubes is defined as the product of the minimum red, green, and blue
-# cubes, what is the sum of the powers of each game?
-sum_powers = 0
-for game in games:
-	max_red = max(round[0] for round in game)
-	max_green = max(round[1] for round in game)
-	max_blue = max(round[2] for round in game)
-	power = max_red * max_green * max_blue
-	sum_powers += power
-print(f"Part 2: The sum of the power of each game is: {sum_powers}")
+# cubes, what is the sum of the powers of each game? The fewest cubes are the maximums we already
+# have, so this is just a product of the columns.
+def part2(games: Games) -> int:
+	return sum(map(mul, map(mul, games.red, games.green), games.blue))
 
+if __name__ == '__main__':
+	games = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The sum of the IDs of the valid games is: {part1(games)}")
+	print(f"Part 2: The sum of the power of each game is: {part2(games)}")
@@ -1,23 +1,11 @@
-import re, sys, copy
-from collections import namedtuple
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import copy, math
+from collections import namedtuple, deque
+import puzzle_input
 
 # Process the input. We have a description of a digital machine, with each line describing the
 # outputs of a flip-flop module ('%'), a conjunction module ('&'), or the broadcaster ('broadcaster').
 # We need to know how many inputs each conjunction module has, so the processing is a bit complicated.
 # We have to keep track of high and low pulses. Let's use True and False for those.
-input_lines = input_text.split('\n')
-
 class Broadcast:
 	def __init__(self, targets: list):
 		self.targets = targets
@@ -60,37 +48,41 @@ class Conjunction:
 	def __str__(self):
 		return f"Conjunction {list(self.inputs)} -> {self.name} -> {self.targets}"
 
-modules = {}
-for line in input_lines:
-	module_text, targets_text = line.split(' -> ')
-	targets = targets_text.split(', ')
-	if module_text[0] == '%':
-		name = module_text[1:]
-		modules[name] = FlipFlop(name, targets)
-	elif module_text[0] == '&':
-		name = module_text[1:]
-		modules[name] = Conjunction(name, targets)
-	else:
-		modules[module_text] = Broadcast(targets)
-
-conjunction_names = [m for m in modules if type(modules[m]) is Conjunction]
-for cn in conjunction_names:
-	for m in modules:
-		if cn in modules[m].targets:
-			modules[cn].add_input(m)
+def parse(text) -> dict:
+	input_lines = puzzle_input.as_view(text).text_lines()
+	modules = {}
+	for line in input_lines:
+		module_text, targets_text = line.split(' -> ')
+		targets = targets_text.split(', ')
+		if module_text[0] == '%':
+			name = module_text[1:]
+			modules[name] = FlipFlop(name, targets)
+		elif module_text[0] == '&':
+			name = module_text[1:]
+			modules[name] = Conjunction(name, targets)
+		else:
+			modules[module_text] = Broadcast(targets)
+
+	conjunction_names = [m for m in modules if type(modules[m]) is Conjunction]
+	for cn in conjunction_names:
+		for m in modules:
+			if cn in modules[m].targets:
+				modules[cn].add_input(m)
+	return modules
 
 # Part 1: Press the button 1000 times, delivering 1000 low pulses to the broadcaster. What is the
 # product of the total number of low and high pulses sent in the system as a result? Note that the
-# low pulses from the button to the broadcaster do count.
+# low pulses from the button to the broadcaster do count. Pulses are handled in the order they're
+# sent, so the events go through a FIFO queue.
 TargetedPulse = namedtuple('TargetedPulse', ['pulse', 'source', 'target'])
 
 def push_button(modules: dict):
-	event_queue = [TargetedPulse(False, 'button', 'broadcaster')]
+	event_queue = deque([TargetedPulse(False, 'button', 'broadcaster')])
 	high_count = 0
 	low_count = 0
 
 	while len(event_queue) > 0:
-		pulse, source, target = event_queue.pop()
+		pulse, source, target = event_queue.popleft()
 		if pulse:
 			high_count += 1
 		else:
@@ -104,18 +96,23 @@ def push_button(modules: dict):
 		#print(f"{source} {pulse} -> {target} becomes {next_pulse}")
 		if next_pulse is not None:
 			for t in modules[target].targets:
-				event_queue.insert(0, TargetedPulse(next_pulse, target, t))
+				event_queue.append(TargetedPulse(next_pulse, target, t))
 
 	return high_count, low_count
 
-total_high = 0
-total_low = 0
-test_modules = copy.deepcopy(modules)
-for pushes in range(1000):
-	hc, lc = push_button(test_modules)
-	total_high += hc
-	total_low += lc
-print(f"Part 1: There were {total_high} high pulses and {total_low} low pulses for a product of: {total_high * total_low}")
+def count_pulses(modules: dict) -> tuple:
+	total_high = 0
+	total_low = 0
+	test_modules = copy.deepcopy(modules)
+	for pushes in range(1000):
+		hc, lc = push_button(test_modules)
+		total_high += hc
+		total_low += lc
+	return total_high, total_low
+
+def part1(modules: dict) -> int:
+	total_high, total_low = count_pulses(modules)
+	return total_high * total_low
 
 # Part 2: Attach a module named rx. What is the fewest number of button presses required to deliver
 # a single low pulse to rx?
@@ -132,36 +129,58 @@ class Receiver:
 	def __str__(self):
 		return f"Receiver {self.name}: {self.activated}"
 
-TargetedPulse = namedtuple('TargetedPulse', ['pulse', 'source', 'targets'])
+TargetedPulse2 = namedtuple('TargetedPulse2', ['pulse', 'source', 'targets'])
 
-def push_button(modules: dict, num_pushes: int):
-	event_queue = [TargetedPulse(False, 'button', ['broadcaster'])]
+# Pushes the button once, and records the push count the first time each input of the watched
+# conjunction module sends it a high pulse
+def push_button_and_watch(modules: dict, num_pushes: int, watched: str, first_high: dict):
+	event_queue = deque([TargetedPulse2(False, 'button', ['broadcaster'])])
 
 	while len(event_queue) > 0:
-		pulse, source, targets = event_queue.pop()
+		pulse, source, targets = event_queue.popleft()
 
 		for target in targets:
 			# Handle output modules
 			if target not in modules:
 				continue
 
-			# rx is fed by a single conjunction module called &lx
-			if target == 'lx' and pulse == True:
-				print(target, pulse, source, num_pushes)
+			if target == watched and pulse == True and source not in first_high:
+				first_high[source] = num_pushes
 
 			next_pulse = modules[target].receive_pulse(source, pulse)
 			if next_pulse is not None:
-				event_queue.insert(0, TargetedPulse(next_pulse, target, modules[target].targets))
+				event_queue.append(TargetedPulse2(next_pulse, target, modules[target].targets))
 
-# Our target module rx will only get a low pulse when &lx gets high pulses on each of its inputs on
-# the same button press. By inspecting the console output, I found that &lx's input modules produce
-# high pulses at the following intervals:
+# Our target module rx will only get a low pulse when the conjunction module feeding it (&lx in my
+# input) gets high pulses on each of its inputs on the same button press. By inspecting the console
+# output, I found that &lx's input modules produce high pulses at the following intervals:
 #   &cl: 3733
 #   &lb: 3911
 #   &rp: 4091
 #   &nj: 4093
 #
-# The least common multiple of these intervals is the answer: 244465191362269
-modules['rx'] = Receiver('rx')
-for pushes in range(1, 13000):
-	push_button(modules, pushes)
+# The least common multiple of these intervals is the answer: 244465191362269. The first high pulse
+# from each input comes at the end of its first interval, so that's all we need to watch for. The
+# example doesn't have an rx module at all, so there's no answer for it.
+def part2(modules: dict) -> int:
+	feeders = [name for name in modules if 'rx' in modules[name].targets]
+	if len(feeders) != 1 or type(modules[feeders[0]]) is not Conjunction:
+		return None
+	watched = feeders[0]
+
+	test_modules = copy.deepcopy(modules)
+	test_modules['rx'] = Receiver('rx')
+	first_high = {}
+	pushes = 0
+	while len(first_high) < len(test_modules[watched].inputs):
+		pushes += 1
+		push_button_and_watch(test_modules, pushes, watched, first_high)
+	return math.lcm(*first_high.values())
+
+if __name__ == '__main__':
+	modules = parse(puzzle_input.load_input(__file__))
+	total_high, total_low = count_pulses(modules)
+	print(f"Part 1: There were {total_high} high pulses and {total_low} low pulses for a product of: {total_high * total_low}")
+	presses = part2(modules)
+	if presses is not None:
+		print(f"Part 2: The fewest number of button presses needed to deliver a low pulse to rx is: {presses}")
@@ -1,150 +1,133 @@
-import re, sys, copy
-from collections import namedtuple
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import puzzle_input
+from grid import Grid
 
 # Process the input. It's a 2-D grid describing a maze. The tiles can be walls ('#'), paths ('.'),
 # and one-way downhill slopes ('^', 'v', '<', '>').
-input_lines = input_text.split('\n')
-grid = input_lines
-x_size = len(input_lines[0])
-y_size = len(input_lines)
+# It goes in a flat grid (see grid.py) with a wall all the way around, so walking along a path never
+# needs a bounds check.
+WALL = ord('#')
+PATH = ord('.')
 
-# The starting and ending points are always next to the corners and can be hard-coded.
-Coord = namedtuple('Coord', ['x', 'y'])
-start = Coord(1, 0)
-end = Coord(x_size - 2, y_size - 1)
-up = Coord(0, -1)
-down = Coord(0, 1)
-left = Coord(-1, 0)
-right = Coord(1, 0)
+def parse(text) -> Grid:
+	return Grid(puzzle_input.as_view(text).text_lines(), border='#')
 
-def add_coords(c1: Coord, c2: Coord) -> Coord:
-	return Coord(c1.x + c2.x, c1.y + c2.y)
+# The starting and ending points are always next to the corners and can be hard-coded.
+def start_and_end(grid: Grid) -> tuple:
+	return grid.index(1, 0), grid.index(grid.x_size - 2, grid.y_size - 1)
 
 # Part 1: What is the length of the longest path from the start to the end? Doing a *longest* path
 # search is a bit unusual, but the real limitation is that we can't step on the same tile twice.
 # This makes it hard (impossible?) to do a BFS. We'll have to do a DFS instead. The optimal way to
 # do this is to build a weighted digraph.
-def is_intersection(x: int, y: int) -> bool:
-	if x > 0 and x < x_size - 1 and y > 0 and y < y_size - 1 and grid[y][x] == '.':
-		num_exits = (grid[y-1][x] != '#') + (grid[y+1][x] != '#') + (grid[y][x-1] != '#') + (grid[y][x+1] != '#')
+def is_intersection(grid: Grid, i: int) -> bool:
+	if grid[i] == PATH and i not in start_and_end(grid):
+		num_exits = sum(grid[i + direction] != WALL for direction in grid.directions)
 		if num_exits == 1:
-			print('Dead end:', x, y)
+			print('Dead end:', *grid.coords(i))
 		return num_exits > 2
 	return False
 
-def print_grid():
-	for y in range(y_size):
-		for x in range(x_size):
-			if is_intersection(x, y):
+def print_grid(grid: Grid):
+	for y in range(grid.y_size):
+		for x in range(grid.x_size):
+			if is_intersection(grid, grid.index(x, y)):
 				print('X', end='')
 			else:
-				print(grid[y][x], end='')
+				print(chr(grid.get(x, y)), end='')
 		print()
 
-nodes = [Coord(x, y) for x in range(x_size) for y in range(y_size) if is_intersection(x, y)]
-nodes.append(start)
-nodes.append(end)
+def find_nodes(grid: Grid) -> tuple:
+	nodes = [grid.index(x, y) for x in range(grid.x_size) for y in range(grid.y_size)
+	         if is_intersection(grid, grid.index(x, y))]
+	nodes.extend(start_and_end(grid))
+	is_node = bytearray(len(grid))
+	for node in nodes:
+		is_node[node] = 1
+	return nodes, is_node
 
 # Now for the edges. We need a convenient way to measure the distance along a path. There aren't any
 # simple dead ends, but there are one-way paths, so we have to account for that. Luckily, the slopes
 # are all right next to the intersections, so we don't have to worry about that for the length. And
 # they all point downhill, so there are no loops in the graph!
-def measure_length_to_next_node(node: Coord, direction: Coord):
+def measure_length_to_next_node(grid: Grid, is_node: bytearray, node: int, direction: int):
 	length = 0
 	while True:
-		node = add_coords(node, direction)
+		node += direction
 		length += 1
-		if is_intersection(node.x, node.y) or node == end or node == start:
+		if is_node[node]:
 			return node, length
 
-		for new_direction in (up, down, left, right):
-			if new_direction != Coord(-1 * direction.x, -1 * direction.y):
-				new_node = add_coords(node, new_direction)
-				if grid[new_node.y][new_node.x] != '#':
-					direction = new_direction
-					break
+		for new_direction in grid.directions:
+			if new_direction != -direction and grid[node + new_direction] != WALL:
+				direction = new_direction
+				break
 
-def find_exits(node: Coord):
+def find_exits(grid: Grid, node: int):
+	slopes = {grid.up: ord('^'), grid.down: ord('v'), grid.left: ord('<'), grid.right: ord('>')}
 	exits = []
-	for direction in (up, down, left, right):
-		adj = add_coords(node, direction)
-		if adj.x >= 0 and adj.x <= x_size - 1 and adj.y > 0 and adj.y <= y_size - 1:
-			tile = grid[adj.y][adj.x]
-			if tile == '.' or (tile == '^' and direction == up) or (tile == 'v' and direction == down) or \
-			   (tile == '<' and direction == left) or (tile == '>' and direction == right):
-				exits.append(direction)
+	for direction in grid.directions:
+		tile = grid[node + direction]
+		if tile == PATH or tile == slopes[direction]:
+			exits.append(direction)
 	return exits
 
-Edge = namedtuple('Edge', ['dest', 'dist'])
-graph: dict[Coord, list[Edge]] = {}
-for node in nodes:
-	graph[node] = []
-	for direction in find_exits(node):
-		next_node, length = measure_length_to_next_node(node, direction)
-		graph[node].append((next_node, length))
+# Both parts build the same kind of graph, just with different rules for which ways out of a node
+# can be taken
+def build_graph(grid: Grid, find_exits) -> dict[int, list[tuple]]:
+	nodes, is_node = find_nodes(grid)
+	graph: dict[int, list[tuple]] = {}
+	for node in nodes:
+		graph[node] = []
+		for direction in find_exits(grid, node):
+			next_node, length = measure_length_to_next_node(grid, is_node, node, direction)
+			graph[node].append((next_node, length))
+	return graph
 
 # Okay, now we can do the actual DFS
-def find_longest_path(node: Coord):
+def find_longest_path(graph: dict, node: int, end: int):
 	if node == end:
 		return 0
 	else:
 		dists = []
 		for next_node, dist in graph[node]:
-			dists.append(dist + find_longest_path(next_node));
+			dists.append(dist + find_longest_path(graph, next_node, end));
 		return max(dists)
 
-longest = find_longest_path(start)
-print(f"Part 1: The longest possible path length is: {longest}")
+def part1(grid: Grid) -> int:
+	start, end = start_and_end(grid)
+	return find_longest_path(build_graph(grid, find_exits), start, end)
 
 # Part 2: We can now climb the slopes, so the graph now has loops. But since we can't step on the
 # same tile twice, we can't visit intersections multiple times, so thankfully we don't have to solve
 # some kind of Bridges of Koenigsburg problem. We do, however, have to keep track of which nodes
-# we've visited already during the recursion.
-def find_exits2(node: Coord):
-	exits = []
-	for direction in (up, down, left, right):
-		adj = add_coords(node, direction)
-		if adj.x >= 0 and adj.x <= x_size - 1 and adj.y > 0 and adj.y <= y_size - 1:
-			tile = grid[adj.y][adj.x]
-			if tile != '#':
-				exits.append(direction)
-	return exits
-
-graph: dict[Coord, list[Edge]] = {}
-for node in nodes:
-	graph[node] = []
-	for direction in find_exits2(node):
-		next_node, length = measure_length_to_next_node(node, direction)
-		graph[node].append((next_node, length))
+# we've visited already during the recursion. That's one flag per grid cell, so checking it doesn't
+# mean searching a list.
+def find_exits2(grid: Grid, node: int):
+	return [direction for direction in grid.directions if grid[node + direction] != WALL]
 
-def find_longest_path2(node: Coord, visited: list[Coord]):
+def find_longest_path2(graph: dict, node: int, end: int, visited: bytearray):
 	if node == end:
 		return 0
 	else:
-		visited.append(node)
+		visited[node] = 1
 		dists = []
 		for next_node, dist in graph[node]:
-			if next_node not in visited:
-				new_dist = find_longest_path2(next_node, visited)
+			if not visited[next_node]:
+				new_dist = find_longest_path2(graph, next_node, end, visited)
 				if new_dist != None:
 					dists.append(dist + new_dist)
-		del visited[-1]
+		visited[node] = 0
 		if len(dists) == 0:
 			return None
 		else:
 			return max(dists)
 
 # Takes about 45 seconds. Inefficient, but usable for a one-time run.
-longest = find_longest_path2(start, [])
-print(f"Part 2: The longest possible path length is: {longest}")
+def part2(grid: Grid) -> int:
+	start, end = start_and_end(grid)
+	return find_longest_path2(build_graph(grid, find_exits2), start, end, bytearray(len(grid)))
+
+if __name__ == '__main__':
+	grid = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The longest possible path length is: {part1(grid)}")
+	print(f"Part 2: The longest possible path length is: {part2(grid)}")
@@ -1,53 +1,38 @@
-import re, sys, copy
-from typing_extensions import Self
-from dataclasses import dataclass
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import re, copy
+import puzzle_input
 
 # Process the input. Each line contains a hailstone's 3-D position and velocity separated by an @.
 # In the problem text, we're also given a "test area", a range of x and y coordinates to use.
 # Apparently a lot of people don't like named tuples, and frankly I'm getting tired of their
 # limitations for representing coordinates, so I'm going to try the more popular dataclasses for
-# this puzzle.
-input_lines = input_text.split('\n')
-if '--example' in sys.argv:
-	test_area_min = 7
-	test_area_max = 27
-else:
-	test_area_min = 200000000000000
-	test_area_max = 400000000000000
+# this puzzle. (It ended up as a plain class after all: the decorator's import took longer than
+# everything else in this file combined.) The example's test area is much smaller than the real
+# one, and its hailstones are all close to the origin, so that's how we tell which one to use.
+example_test_area = (7, 27)
+real_test_area = (200000000000000, 400000000000000)
 
-@dataclass
 class Vector:
-	x: float
-	y: float
-	z: float
+	def __init__(self, x: float, y: float, z: float):
+		self.x = x
+		self.y = y
+		self.z = z
 	
-	def __add__(self, v: Self) -> Self:
+	def __add__(self, v: 'Vector') -> 'Vector':
 		return type(self)(self.x + v.x, self.y + v.y, self.z + v.z)
 
-	def __sub__(self, v: Self) -> Self:
+	def __sub__(self, v: 'Vector') -> 'Vector':
 		return type(self)(self.x - v.x, self.y - v.y, self.z - v.z)
 	
-	def __neg__(self) -> Self:
+	def __neg__(self) -> 'Vector':
 		return type(self)(-self.x, -self.y, -self.z)
 	
-	def __mul__(self, c: float) -> Self:
+	def __mul__(self, c: float) -> 'Vector':
 		return type(self)(c * self.x, c * self.y, c * self.z)
 	
-	def __rmul__(self, c: float) -> Self:
+	def __rmul__(self, c: float) -> 'Vector':
 		return self * c
 	
-	def __truediv__(self, v: Self) -> Self:
+	def __truediv__(self, v: 'Vector') -> 'Vector':
 		qx = (self.x / v.x) if v.x != 0 else 0
 		qy = (self.y / v.y) if v.y != 0 else 0
 		qz = (self.z / v.z) if v.z != 0 else 0
@@ -56,17 +41,18 @@ class Vector:
 	def __str__(self) -> str:
 		return f"({self.x},{self.y},{self.z})"
 
-positions = []
-velocities = []
-for line in input_lines:
-	nums = re.findall(r'(\-?\d+)', line)
-	positions.append(Vector(float(nums[0]), float(nums[1]), float(nums[2])))
-	velocities.append(Vector(float(nums[3]), float(nums[4]), float(nums[5])))
+def parse(text) -> tuple:
+	positions = []
+	velocities = []
+	for line in puzzle_input.as_view(text).text_lines():
+		nums = re.findall(r'(\-?\d+)', line)
+		positions.append(Vector(float(nums[0]), float(nums[1]), float(nums[2])))
+		velocities.append(Vector(float(nums[3]), float(nums[4]), float(nums[5])))
+	test_area = example_test_area if max(p.x for p in positions) < real_test_area[0] else real_test_area
+	return positions, velocities, test_area
 
 # Part 1: Looking at the 2-D x-y plane *only*, find where the hailstones intersect. How many
 # intersections are within the test area?
-flat_pos = [Vector(p.x, p.y, 0) for p in positions]
-flat_vel = [Vector(v.x, v.y, 0) for v in velocities]
 
 # Time for some algebra. The equation for a hailstone's 2-D path is:
 #   m = v.y / v.x
@@ -89,19 +75,21 @@ def find_2d_intersection(p1: Vector, v1: Vector, p2: Vector, v2: Vector) -> Vect
 
 # To count as a valid hit, the two hailstone paths have to cross inside the target area *and* in the
 # future of *both* hailstones.
-num_valid_hits = 0
-for h1 in range(len(positions) - 1):
-	for h2 in range(h1 + 1, len(positions)):
-		intersection = find_2d_intersection(positions[h1], velocities[h1], positions[h2], velocities[h2])
-		if intersection is None:
-			continue
-		
-		dt1 = (intersection.x - positions[h1].x) / velocities[h1].x
-		dt2 = (intersection.x - positions[h2].x) / velocities[h2].x
-		if dt1 > 0 and dt2 > 0 and intersection.x >= test_area_min and intersection.x <= test_area_max and \
-		              intersection.y >= test_area_min and intersection.y <= test_area_max:
-			num_valid_hits += 1
-print(f"Part 1: The number of intersections in the target area is: {num_valid_hits}")
+def part1(data: tuple) -> int:
+	positions, velocities, (test_area_min, test_area_max) = data
+	num_valid_hits = 0
+	for h1 in range(len(positions) - 1):
+		for h2 in range(h1 + 1, len(positions)):
+			intersection = find_2d_intersection(positions[h1], velocities[h1], positions[h2], velocities[h2])
+			if intersection is None:
+				continue
+
+			dt1 = (intersection.x - positions[h1].x) / velocities[h1].x
+			dt2 = (intersection.x - positions[h2].x) / velocities[h2].x
+			if dt1 > 0 and dt2 > 0 and intersection.x >= test_area_min and intersection.x <= test_area_max and \
+			              intersection.y >= test_area_min and intersection.y <= test_area_max:
+				num_valid_hits += 1
+	return num_valid_hits
 
 # Part 2: We want to throw a rock from an arbitrary position with an arbitrary velocity and hit
 # every hailstone as it falls. Find the position and velocity required to do this, then find the
@@ -125,73 +113,30 @@ def prime_factors(n):
         factors.append(n)
     return factors
 
-# This method seems to work on the real input but not on the example
-intset = None
-for h1 in range(len(velocities) - 1):
-	for h2 in range(h1+1, len(velocities)):
-		if velocities[h1].x == velocities[h2].x:
-			pdiff = int(abs(positions[h2].x - positions[h1].x))
-			vel = int((velocities[h1].x))
-			modset = set()
-			for v in range(-5000, 5000):
-				if v != vel and pdiff % (v - vel) == 0:
-					modset.add(v)
-			if intset is None:
-				intset = modset
-			else:
-				intset = intset.intersection(modset)
-			if len(intset) == 1:
-				rock_vx = list(intset)[0]
-				break
-	if intset and len(intset) == 1:
-		break
-
-intset = None
-for h1 in range(len(velocities) - 1):
-	for h2 in range(h1+1, len(velocities)):
-		if velocities[h1].y == velocities[h2].y:
-			pdiff = int(abs(positions[h2].y - positions[h1].y))
-			vel = int((velocities[h1].y))
-			modset = set()
-			for v in range(-5000, 5000):
-				if v != vel and pdiff % (v - vel) == 0:
-					modset.add(v)
-			if intset is None:
-				intset = modset
-			else:
-				intset = intset.intersection(modset)
-			if len(intset) == 1:
-				rock_vy = list(intset)[0]
-				break
-	if intset and len(intset) == 1:
-		break
-
-intset = None
-for h1 in range(len(velocities) - 1):
-	for h2 in range(h1+1, len(velocities)):
-		if velocities[h1].z == velocities[h2].z:
-			pdiff = int(abs(positions[h2].z - positions[h1].z))
-			vel = int((velocities[h1].z))
-			modset = set()
-			for v in range(-5000, 5000):
-				if v != vel and pdiff % (v - vel) == 0:
-					modset.add(v)
-			if intset is None:
-				intset = modset
-			else:
-				intset = intset.intersection(modset)
-			if len(intset) == 1:
-				rock_vz = list(intset)[0]
-				break
-	if intset and len(intset) == 1:
-		break
-
-vrock = Vector(rock_vx, rock_vy, rock_vz)
-print("Rock velocity:", vrock)  # (133,278,85) on the real input
+# This method seems to work on the real input but not on the example, where it can't narrow the
+# velocity down to a single value. The same search is done for each axis.
+def find_rock_velocity(positions: list, velocities: list, axis: str) -> int:
+	intset = None
+	for h1 in range(len(velocities) - 1):
+		for h2 in range(h1+1, len(velocities)):
+			if getattr(velocities[h1], axis) == getattr(velocities[h2], axis):
+				pdiff = int(abs(getattr(positions[h2], axis) - getattr(positions[h1], axis)))
+				vel = int(getattr(velocities[h1], axis))
+				modset = set()
+				for v in range(-5000, 5000):
+					if v != vel and pdiff % (v - vel) == 0:
+						modset.add(v)
+				if intset is None:
+					intset = modset
+				else:
+					intset = intset.intersection(modset)
+				if len(intset) == 1:
+					return list(intset)[0]
+	return None
 
 # Well, none of the weird regularities that people online reported in the input apply to me, so I
-# guess I'm solving a (simplified) system of equations. I'm just going to dump this into Wolfram
-# Alpha or something; there's no point in forcing Python to do this.
+# guess I'm solving a (simplified) system of equations. I dumped it into Wolfram Alpha the first
+# time around, but with the velocity known it's only two unknowns per pair of hailstones:
 #
 # rx + t1*rvx = h1x + t1*h1vx    # Repeat for y and z and do two hailstones
 #
@@ -201,9 +146,51 @@ print("Rock velocity:", vrock)  # (133,278,85) on the real input
 # x + u*133 = 285259862606823 + u*12
 # y + u*278 = 407476720802151 + u*-120
 #
-# x = 200027938836082
-# y = 127127087242193
-# z = 219339468239370
-print(f"Part 2: The sum of the coordinates is: {200027938836082 + 127127087242193 + 219339468239370}")
-
-
+# Relative to the rock, each hailstone moves at w = v - rv and has to pass through the rock's
+# starting point, so p1 + t*w1 = p2 + u*w2. Any two axes where the hailstones' paths aren't parallel
+# give t by Cramer's rule, and the rock's starting point is p1 + t*w1. Everything here is an integer
+# (the floats are whole numbers well under 2**53), so the answer is exact. If the velocity search
+# picked the wrong velocity, some hailstone won't line up with the rock, so every one gets checked.
+def find_rock_position(positions: list, velocities: list, vrock: Vector) -> Vector:
+	p1 = [int(getattr(positions[0], axis)) for axis in 'xyz']
+	w1 = [int(getattr(velocities[0] - vrock, axis)) for axis in 'xyz']
+	for h in range(1, len(positions)):
+		p2 = [int(getattr(positions[h], axis)) for axis in 'xyz']
+		w2 = [int(getattr(velocities[h] - vrock, axis)) for axis in 'xyz']
+		for a, b in ((0, 1), (0, 2), (1, 2)):
+			det = w2[a]*w1[b] - w1[a]*w2[b]
+			if det == 0:
+				continue
+			t, remainder = divmod(w2[a]*(p2[b] - p1[b]) - w2[b]*(p2[a] - p1[a]), det)
+			if remainder != 0:
+				return None
+			rock = [p1[n] + t*w1[n] for n in range(3)]
+			if all(hits_rock(rock, positions[i], velocities[i] - vrock) for i in range(len(positions))):
+				return Vector(*rock)
+			return None
+	return None
+
+# A hailstone hits the rock if its offset from the rock's start is parallel to its relative velocity
+def hits_rock(rock: list, p: Vector, w: Vector) -> bool:
+	d = [int(p.x) - rock[0], int(p.y) - rock[1], int(p.z) - rock[2]]
+	w = [int(w.x), int(w.y), int(w.z)]
+	return d[1]*w[2] == d[2]*w[1] and d[2]*w[0] == d[0]*w[2] and d[0]*w[1] == d[1]*w[0]
+
+# (133,278,85) on the real input, which gives the rock position
+# (200027938836082,127127087242193,219339468239370)
+def part2(data: tuple) -> int:
+	positions, velocities, _ = data
+	vrock = Vector(*(find_rock_velocity(positions, velocities, axis) for axis in 'xyz'))
+	if None in (vrock.x, vrock.y, vrock.z):
+		return None
+	prock = find_rock_position(positions, velocities, vrock)
+	if prock is None:
+		return None
+	return prock.x + prock.y + prock.z
+
+if __name__ == '__main__':
+	data = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The number of intersections in the target area is: {part1(data)}")
+	total = part2(data)
+	if total is not None:
+		print(f"Part 2: The sum of the coordinates is: {total}")
@@ -1,59 +1,95 @@
 import re, sys
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+from collections import deque
+import puzzle_input
+from grid import Grid
 
 # Process the input. It's a 2-D text grid containing (horizontal) numbers and punctuations marks,
-# with periods used as spacers. We'll strip out the periods to make identifying punctuation easier.
-input_lines = input_text.replace('.', ' ').split('\n')
-schematic = input_lines
-max_y = len(schematic) - 1
-max_x = len(schematic[0]) - 1
+# with periods used as spacers. Everything either part needs can be found in one pass: the grid goes
+# in a flat grid (see grid.py) with a border of periods, each number gets an id, and every cell of
+# the number is labelled with that id in a list that parallels the grid cells. The punctuation
+# marks go in a list of their own. Then finding the numbers next to a mark is just a lookup in each
+# of the eight directions.
+number_pattern = re.compile(rb'\d+')
+punctuation_pattern = re.compile(rb'[^\d.]')
+STAR = ord('*')
+
+class SchematicIndex:
+	def __init__(self, grid: Grid):
+		self.grid = grid
+		self.labels = [-1] * len(grid)
+		self.values = []
+		self.punctuation = []
+		for y in range(grid.y_size):
+			row = bytes(grid.row(y))
+			row_start = grid.index(0, y)
+			for match in number_pattern.finditer(row):
+				self.labels[row_start + match.start():row_start + match.end()] = [len(self.values)] * (match.end() - match.start())
+				self.values.append(int(match[0]))
+			for match in punctuation_pattern.finditer(row):
+				self.punctuation.append(row_start + match.start())
+		self.around = (grid.up - 1, grid.up, grid.up + 1, -1, 1, grid.down - 1, grid.down, grid.down + 1)
+
+	# The ids of the numbers touching a cell, each one once
+	def adjacent_numbers(self, i: int) -> set:
+		labels = self.labels
+		ids = {labels[i + d] for d in self.around}
+		ids.discard(-1)
+		return ids
+
+def parse(text) -> SchematicIndex:
+	return SchematicIndex(Grid(puzzle_input.as_view(text).text_lines(), border='.'))
+
+# The original solution below works on lines of text with the periods stripped out, and is kept as
+# the reference for verify.py
+def schematic_lines(index: SchematicIndex) -> list:
+	return str(index.grid).replace('.', ' ').split('\n')
 
 # Part 1: If any number adjacent to a punctuation mark (even diagonally) is a part number, what is
 # the sum of all of the part numbers? Let's find the coordinates, length, and bounding box of each
 # number to aid in our search. Note that there *are* duplicate numbers in the real input!
-all_numbers = []
-for y in range(max_y + 1):
-	for match in re.finditer(r'\d+', input_lines[y]):
-		num = int(match[0])
-		x = match.start()
-		length = match.end() - x
-		all_numbers.append({'number': num, 'x': x, 'y': y, 'len': length})
+def find_numbers(schematic: list) -> list:
+	all_numbers = []
+	for y in range(len(schematic)):
+		for match in re.finditer(r'\d+', schematic[y]):
+			num = int(match[0])
+			x = match.start()
+			length = match.end() - x
+			all_numbers.append({'number': num, 'x': x, 'y': y, 'len': length})
+	return all_numbers
 
 # Check the bounding box around the number for punctuation characters
-def is_punctuation(x, y):
-	if x >= 0 and x <= max_x and y >= 0 and y <= max_y:
+def is_punctuation(schematic: list, x, y):
+	if x >= 0 and x < len(schematic[0]) and y >= 0 and y < len(schematic):
 		char = schematic[y][x]
 		return not (char.isdigit() or char == ' ')
 	else:
 		return False
 
-def has_adjacent_punctuation(number: dict):
+def has_adjacent_punctuation(schematic: list, number: dict):
 	bbxi = number['x'] - 1
 	bbxf = number['x'] + number['len']
 	bbyi = number['y'] - 1
 	bbyf = number['y'] + 1
 	for y in (bbyi, bbyf):
 		for x in range(bbxi, bbxf + 1):
-			if is_punctuation(x, y):
+			if is_punctuation(schematic, x, y):
 				return True
-	if is_punctuation(bbxi, number['y']):
+	if is_punctuation(schematic, bbxi, number['y']):
 		return True
-	if is_punctuation(bbxf, number['y']):
+	if is_punctuation(schematic, bbxf, number['y']):
 		return True
 	return False
 
-sum_part_numbers = sum(number['number'] for number in all_numbers if has_adjacent_punctuation(number))
-print(f"Part 1: The sum of the part numbers is: {sum_part_numbers}")
+def reference_part1(index: SchematicIndex) -> int:
+	schematic = schematic_lines(index)
+	return sum(number['number'] for number in find_numbers(schematic) if has_adjacent_punctuation(schematic, number))
+
+# With the index, it's the other way around: collect the numbers around every punctuation mark
+def part1(index: SchematicIndex) -> int:
+	part_numbers = set()
+	for i in index.punctuation:
+		part_numbers |= index.adjacent_numbers(i)
+	return sum(index.values[id] for id in part_numbers)
 
 # Part 2: A gear is any * with exactly two adjacent numbers. If the "gear ratio" is the product of
 # those two numbers, what is the sum of all gear ratios in the schematic? Time for more regexes!
@@ -61,14 +97,14 @@ def match_is_adjacent(match: re.Match, x):
 	st = match.start()
 	ed = match.end() - 1
 	return (st >= x - 1 and st <= x + 1) or (ed >= x - 1 and ed <= x + 1)
-	
-def find_adjacent_numbers(x, y):
+
+def find_adjacent_numbers(input_lines: list, x, y):
 	nums = []
 	if y >= 1:
 		for match in re.finditer(r'\d+', input_lines[y-1]):
 			if match_is_adjacent(match, x):
 				nums.append(int(match[0]))
-	if y < max_y:
+	if y < len(input_lines) - 1:
 		for match in re.finditer(r'\d+', input_lines[y+1]):
 			if match_is_adjacent(match, x):
 				nums.append(int(match[0]))
@@ -77,11 +113,90 @@ def find_adjacent_numbers(x, y):
 			nums.append(int(match[0]))
 	return nums
 
-ratios = []
-for y in range(max_y + 1):
-	for x in range(max_x + 1):
-		if schematic[y][x] == '*':
-			adjacent = find_adjacent_numbers(x, y)
+def reference_part2(index: SchematicIndex) -> int:
+	schematic = schematic_lines(index)
+	ratios = []
+	for y in range(len(schematic)):
+		for x in range(len(schematic[0])):
+			if schematic[y][x] == '*':
+				adjacent = find_adjacent_numbers(schematic, x, y)
+				if len(adjacent) == 2:
+					ratios.append(adjacent[0] * adjacent[1])
+	return sum(ratios)
+
+def part2(index: SchematicIndex) -> int:
+	total = 0
+	for i in index.punctuation:
+		if index.grid[i] == STAR:
+			adjacent = index.adjacent_numbers(i)
 			if len(adjacent) == 2:
-				ratios.append(adjacent[0] * adjacent[1])
-print(f"Part 2: The sum of the gear ratios is: {sum(ratios)}")
+				id1, id2 = adjacent
+				total += index.values[id1] * index.values[id2]
+	return total
+
+# For schematics too big to hold in memory, both answers can be worked out as the rows go by. A
+# punctuation mark only touches the rows above and below it, so once the row after it has arrived,
+# everything about it is known, and only three rows ever need to be kept. Each row keeps the same
+# kind of labels as the index above (padded with a -1 at each end so the edges don't need checks),
+# but the number ids keep counting up across rows. A number can touch marks in two different rows,
+# so the ids already counted for part 1 are remembered until their row drops out of the window.
+class WindowRow:
+	def __init__(self, row: bytes, first_id: int, values: dict):
+		self.labels = [-1] * (len(row) + 2)
+		self.ids = []
+		for match in number_pattern.finditer(row):
+			id = first_id + len(self.ids)
+			self.labels[match.start() + 1:match.end() + 1] = [id] * (match.end() - match.start())
+			self.ids.append(id)
+			values[id] = int(match[0])
+		self.punctuation = [(match.start() + 1, row[match.start()]) for match in punctuation_pattern.finditer(row)]
+
+	def label(self, x: int) -> int:
+		return self.labels[x] if x < len(self.labels) else -1
+
+def stream_sums(rows) -> tuple:
+	part_number_sum = 0
+	gear_ratio_sum = 0
+	values = {}
+	counted = set()
+	next_id = 0
+	window = deque([WindowRow(b'', 0, values)])
+
+	# Settle the middle row of the window
+	def settle(above: WindowRow, row: WindowRow, below: WindowRow):
+		nonlocal part_number_sum, gear_ratio_sum
+		for x, char in row.punctuation:
+			adjacent = {r.label(x + dx) for r in (above, row, below) for dx in (-1, 0, 1)}
+			adjacent.discard(-1)
+			for id in adjacent - counted:
+				part_number_sum += values[id]
+				counted.add(id)
+			if char == STAR and len(adjacent) == 2:
+				id1, id2 = adjacent
+				gear_ratio_sum += values[id1] * values[id2]
+
+	for row in rows:
+		window.append(WindowRow(bytes(row), next_id, values))
+		next_id += len(window[-1].ids)
+		if len(window) == 3:
+			settle(*window)
+			for id in window.popleft().ids:
+				del values[id]
+				counted.discard(id)
+	window.append(WindowRow(b'', next_id, values))
+	if len(window) == 3:
+		settle(*window)
+	return part_number_sum, gear_ratio_sum
+
+if __name__ == '__main__':
+	# python Day3.py --stream schematic.txt
+	if '--stream' in sys.argv:
+		with open(sys.argv[sys.argv.index('--stream') + 1], 'rb') as f:
+			part_number_sum, gear_ratio_sum = stream_sums(line.rstrip(b'\n') for line in f)
+		print(f"Part 1: The sum of the part numbers is: {part_number_sum}")
+		print(f"Part 2: The sum of the gear ratios is: {gear_ratio_sum}")
+		sys.exit(0)
+
+	index = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The sum of the part numbers is: {part1(index)}")
+	print(f"Part 2: The sum of the gear ratios is: {part2(index)}")
@@ -1,56 +1,67 @@
-import re, sys
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+from array import array
+import puzzle_input
 
 # Process the input. Each line is a single numbered scratchcard listing winning numbers followed by
-# numbers we have.
-input_lines = input_text.split('\n')
-num_games = len(input_lines)
-winning_numbers = []
-numbers_we_have = []
-for line in input_lines:
-	winning_numbers_text = line.split(': ')[1].split(' |')[0]
-	numbers_we_have_text = line.split(' |')[1]
-	winning_numbers_list = [int(n) for n in re.findall(r'\d+', winning_numbers_text)]
-	numbers_we_have_list = [int(n) for n in re.findall(r'\d+', numbers_we_have_text)]
-	winning_numbers.append(winning_numbers_list)
-	numbers_we_have.append(numbers_we_have_list)
+# numbers we have. Both parts only care about how many of our numbers are winners, so that's all
+# that gets kept, one count per card. Numbers never repeat within a list, so the count is the size
+# of the intersection, and the numbers don't even need converting from text.
+def parse(text) -> array:
+	match_counts = array('H')
+	for line in puzzle_input.as_view(text).text_lines():
+		winning_numbers_text, _, numbers_we_have_text = line.partition(': ')[2].partition(' |')
+		match_counts.append(len(set(winning_numbers_text.split()).intersection(numbers_we_have_text.split())))
+	return match_counts
 
 # Part 1: Find how many winning numbers we have in each game. The score for each game is one for
 # the first winning number and doubles for each extra winning number. What is the total point score?
-total_score = 0
-for game in range(num_games):
-	num_matches = sum(1 for n in numbers_we_have[game] if n in winning_numbers[game])
-	total_score += int(2**(num_matches - 1))
-print(f"Part 1: The total point value of the cards is: {total_score}")
+def part1(match_counts: array) -> int:
+	return sum(1 << (num_matches - 1) for num_matches in match_counts if num_matches > 0)
 
 # Part 2: Winning numbers now cause us to win copies of scratchcards. The number of matches gives
 # the number of copies, and copies from from the cards further down the list. How many total
 # scratchcards do we end up with? This looks simple but the number of cards to process grows
 # quadratically, so we need to save our results.
-cards_won_cache = {}
-
-def count_cards_won(card: int) -> int:
-	if card in cards_won_cache:
-		return cards_won_cache[card]
-
-	num_wins = 0
-	num_matches = sum(1 for n in numbers_we_have[card] if n in winning_numbers[card])
-	num_wins += num_matches
-	for n in range(card + 1, card + 1 + num_matches):
-		num_wins += cards_won_cache[n] if n in cards_won_cache else count_cards_won(n)
-	cards_won_cache[card] = num_wins
-	return num_wins
-
-card_queue = list(reversed(range(num_games)))
-total_cards_won = sum(count_cards_won(card) for card in card_queue)
-print(f"Part 2: The number of scratchcards we end up with is: {total_cards_won + num_games}")
+# Better yet, copies only ever go to later cards, so we can go down the list once. When we get to a
+# card, every copy of it has already been won. All of its copies then win one copy each of the next
+# num_matches cards, which is a range update: add at the start of the range and take it back off at
+# the end, and a running total of those changes gives the copies won of the current card.
+def part2(match_counts: array) -> int:
+	num_games = len(match_counts)
+	changes = [0] * (num_games + 1)
+	copies_won = 0
+	total_cards = 0
+	for card in range(num_games):
+		copies_won += changes[card]
+		num_copies = 1 + copies_won
+		total_cards += num_copies
+		num_matches = match_counts[card]
+		if num_matches > 0:
+			changes[card + 1] += num_copies
+			changes[min(card + 1 + num_matches, num_games)] -= num_copies
+	return total_cards
+
+# This was the first version, which verify.py checks the one above against
+def reference_part2(match_counts: array) -> int:
+	num_games = len(match_counts)
+	cards_won_cache = {}
+
+	def count_cards_won(card: int) -> int:
+		if card in cards_won_cache:
+			return cards_won_cache[card]
+
+		num_wins = 0
+		num_matches = match_counts[card]
+		num_wins += num_matches
+		for n in range(card + 1, card + 1 + num_matches):
+			num_wins += cards_won_cache[n] if n in cards_won_cache else count_cards_won(n)
+		cards_won_cache[card] = num_wins
+		return num_wins
+
+	card_queue = list(reversed(range(num_games)))
+	total_cards_won = sum(count_cards_won(card) for card in card_queue)
+	return total_cards_won + num_games
+
+if __name__ == '__main__':
+	cards = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The total point value of the cards is: {part1(cards)}")
+	print(f"Part 2: The number of scratchcards we end up with is: {part2(cards)}")
@@ -1,46 +1,137 @@
-import re, sys
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import re
+from bisect import bisect_right
+import puzzle_input
 
 # Process the input. There's an initial list of seeds along with a collection of multi-line maps.
 # The maps all have names but they're basically an order, so we don't need to worry about them.
-input_blocks = input_text.split('\n\n')
-seeds = [int(n) for n in re.findall(r'\d+', input_blocks[0])]
-
-maps = []
-for block in range(1, len(input_blocks)):
-	maps.append([])
-	lines = input_blocks[block].split('\n')[1:]
-	for line in lines:
-		nums = [int(n) for n in re.findall(r'\d+', line)]
-		maps[block - 1].append({'dest': nums[0], 'src': nums[1], 'range': nums[2]})
-
+def parse(text) -> tuple:
+	input_blocks = list(puzzle_input.as_view(text).blocks())
+	seeds = [int(n) for n in re.findall(r'\d+', input_blocks[0].text())]
+
+	maps = []
+	for block in range(1, len(input_blocks)):
+		maps.append([])
+		lines = input_blocks[block].text_lines()[1:]
+		for line in lines:
+			nums = [int(n) for n in re.findall(r'\d+', line)]
+			maps[block - 1].append({'dest': nums[0], 'src': nums[1], 'range': nums[2]})
+	return seeds, maps
+
+# Part 1: Run each seed through all of the maps in order. What's the lowest location we end up at?
 def do_mapping(value, maps):
 	for map in maps:
 		if value >= map['src'] and value < map['src'] + map['range']:
 			return map['dest'] + (value - map['src'])
 	return value
 
-mapped_values = seeds
-for vmap in maps:
-	mfunc = lambda value: do_mapping(value, vmap)
-	mapped_values = list(map(mfunc, mapped_values))
-print(f"Part 1: The lowest location value is: {min(mapped_values)}")
+# This was the original solution, which verify.py checks the composed maps below against
+def reference_part1(almanac: tuple) -> int:
+	seeds, maps = almanac
+	mapped_values = seeds
+	for vmap in maps:
+		mfunc = lambda value: do_mapping(value, vmap)
+		mapped_values = list(map(mfunc, mapped_values))
+	return min(mapped_values)
+
+# Scanning every rule of every map for every value adds up for lots of values. Instead, each map
+# can be written as a piecewise function over all of the numbers: piece n covers starts[n] up to
+# (but not including) starts[n+1], or everything from starts[n] up for the last piece, and adds
+# offsets[n] to whatever it's given. The gaps between rules are just pieces with an offset of zero.
+# Two of these compose into another one whose pieces are where the first one's pieces land on the
+# second one's, so all seven maps become a single seed-to-location function. A lookup is then a
+# binary search for the piece.
+class PiecewiseMap:
+	def __init__(self, starts: list, offsets: list):
+		self.starts = starts
+		self.offsets = offsets
+
+	def __call__(self, value: int) -> int:
+		return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+	# For bulk lookups. Any sequence of seeds works, e.g. a list or an array('q').
+	def map_values(self, values) -> list:
+		starts = self.starts
+		offsets = self.offsets
+		return [value + offsets[bisect_right(starts, value) - 1] for value in values]
+
+	def then(self, other: 'PiecewiseMap') -> 'PiecewiseMap':
+		starts = []
+		offsets = []
+		ends = self.starts[1:] + [None]
+		for start, end, offset in zip(self.starts, ends, self.offsets):
+			n = bisect_right(other.starts, start + offset) - 1
+			while True:
+				piece_offset = offset + other.offsets[n]
+				piece_start = max(start, other.starts[n] - offset)
+				if not offsets or offsets[-1] != piece_offset:
+					starts.append(piece_start)
+					offsets.append(piece_offset)
+				n += 1
+				if n == len(other.starts) or (end is not None and other.starts[n] - offset >= end):
+					break
+		return PiecewiseMap(starts, offsets)
+
+def piecewise_map(vmap: list) -> PiecewiseMap:
+	starts = [0]
+	offsets = [0]
+	for rule in sorted(vmap, key=lambda rule: rule['src']):
+		if rule['src'] == starts[-1]:
+			offsets[-1] = rule['dest'] - rule['src']
+		else:
+			starts.append(rule['src'])
+			offsets.append(rule['dest'] - rule['src'])
+		starts.append(rule['src'] + rule['range'])
+		offsets.append(0)
+	return PiecewiseMap(starts, offsets)
+
+def compose_maps(maps: list) -> PiecewiseMap:
+	composed = PiecewiseMap([0], [0])
+	for vmap in maps:
+		composed = composed.then(piecewise_map(vmap))
+	return composed
+
+def part1(almanac: tuple) -> int:
+	seeds, maps = almanac
+	return min(compose_maps(maps).map_values(seeds))
 
 # Part 2: The seed numbers now describe ranges. Each pair of numbers represents a starting value
-# and a range. The real input represents billions of seeds. This cannot be brute-forced. But (and
-# I must admit I found this hint online) we can reverse the maps and start searching from the low
-# end of the location range looking for a seed that's in one of our seed ranges. This is still
-# brute force, but starting out with a sparse search lets me tune in on the right value by hand.
+# and a range. The real input represents billions of seeds. This cannot be brute-forced. Instead,
+# whole ranges go through the maps. Each rule cuts a range into the part before the rule, the part
+# the rule covers (which gets mapped), and the part after it. The leftover pieces go on to the
+# rest of the rules, and whatever no rule covers keeps its numbers. Ranges are (start, end) with
+# the end excluded. The number of pieces only grows with the number of rules, so the size of the
+# numbers doesn't matter, and the lowest location is just the lowest start at the end.
+def seed_ranges(seeds: list) -> list:
+	return [(seeds[s], seeds[s] + seeds[s+1]) for s in range(0, len(seeds), 2)]
+
+def map_ranges(ranges: list, vmap: list) -> list:
+	mapped = []
+	for rule in vmap:
+		src_start = rule['src']
+		src_end = src_start + rule['range']
+		offset = rule['dest'] - src_start
+		unmapped = []
+		for start, end in ranges:
+			if start < min(end, src_start):
+				unmapped.append((start, min(end, src_start)))
+			if max(start, src_start) < min(end, src_end):
+				mapped.append((max(start, src_start) + offset, min(end, src_end) + offset))
+			if max(start, src_end) < end:
+				unmapped.append((max(start, src_end), end))
+		ranges = unmapped
+	return mapped + ranges
+
+def part2(almanac: tuple) -> int:
+	seeds, maps = almanac
+	ranges = seed_ranges(seeds)
+	for vmap in maps:
+		ranges = map_ranges(ranges, vmap)
+	return min(start for start, _ in ranges)
+
+# This was the original solution (and I must admit I found this hint online): reverse the maps and
+# start searching from the low end of the location range looking for a seed that's in one of our
+# seed ranges. It used to start from a hand-tuned spot near the answer, but verify.py only runs it
+# on small inputs, so here it starts from zero.
 def do_reverse_mapping(value, rmaps):
 	for map in rmaps:
 		if value >= map['dest'] and value < map['dest'] + map['range']:
@@ -59,28 +150,22 @@ def get_location_from_seed(seed, all_maps):
 		val = do_mapping(val, vmap)
 	return val
 
-seed_ranges = []
-for s in range(0, len(seeds), 2):
-	seed_ranges.append((seeds[s], seeds[s+1]))
-
 def seed_in_ranges(seed, ranges):
 	for r in ranges:
-		if seed >= r[0] and seed < r[0] + r[1]:
+		if seed >= r[0] and seed < r[1]:
 			return True
 	return False
 
-reversed_maps = list(reversed(maps))
-for location in range(20000000, 21000000, 1):
-	seed = get_seed_from_location(location, reversed_maps)
-	if seed_in_ranges(seed, seed_ranges):
-		print(f"Part 2: The lowest location that corresponds to a given seed is: {location}")
-		break
-
-
-
-
-
-
-
-
-
+def reference_part2(almanac: tuple) -> int:
+	seeds, maps = almanac
+	ranges = seed_ranges(seeds)
+	reversed_maps = list(reversed(maps))
+	location = 0
+	while not seed_in_ranges(get_seed_from_location(location, reversed_maps), ranges):
+		location += 1
+	return location
+
+if __name__ == '__main__':
+	almanac = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The lowest location value is: {part1(almanac)}")
+	print(f"Part 2: The lowest location that corresponds to a given seed is: {part2(almanac)}")
@@ -1,20 +1,12 @@
-import re, sys, math
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import re, math
+import puzzle_input
 
 # Process the input. There's a list of times on one line and a list of distances on the other line.
-input_lines = input_text.split('\n')
-times = [int(n) for n in re.findall(r'\d+', input_lines[0])]
-distances = [int(n) for n in re.findall(r'\d+', input_lines[1])]
+def parse(text) -> tuple:
+	input_lines = puzzle_input.as_view(text).text_lines()
+	times = [int(n) for n in re.findall(r'\d+', input_lines[0])]
+	distances = [int(n) for n in re.findall(r'\d+', input_lines[1])]
+	return times, distances
 
 # Part 1: Holding down the button on the boat increases its speed by 1 mm/ms/ms. How many different
 # lengths of time (in integer milliseconds) can we hold down the button in each race and still beat
@@ -35,23 +27,65 @@ distances = [int(n) for n in re.findall(r'\d+', input_lines[1])]
 # Rounding the first root up and the second root down to the nearest integer gives us the shortest
 # and longest times we can hold the button and still win. Note that we do have to *beat* the record,
 # so if the root is an integer we need to round up anyway!
-win_count_product = 1
-for race in range(len(times)):
-	T = times[race]
-	R = distances[race]
+#
+# Floats only have 53 bits, though, and T^2 for a big enough race is past that. math.isqrt gives the
+# exact integer square root instead, which puts the shortest winning time within a step or so of
+# where it should be. Checking the actual distance and nudging it from there makes it exact for any
+# size of number. The winning times are symmetric around T/2, so the longest one is T minus the
+# shortest.
+def count_ways_to_win(T: int, R: int) -> int:
+	discriminant = T*T - 4*R
+	if discriminant < 0:
+		return 0
+	h = (T - math.isqrt(discriminant)) // 2
+	while h > 0 and (h - 1) * (T - h + 1) > R:
+		h -= 1
+	while 2*h <= T and h * (T - h) <= R:
+		h += 1
+	return max(0, T - 2*h + 1)
+
+# For lots of races at once, e.g. from a generated file. Everything stays in integers, so there's
+# no limit on the size of the numbers.
+def count_ways_to_win_all(times, records) -> list:
+	return list(map(count_ways_to_win, times, records))
+
+# This was the original floating-point version, which verify.py checks the exact one against
+def count_ways_to_win_float(T: int, R: int) -> int:
 	low_root = T/2 - math.sqrt(T*T - 4*R)/2
 	high_root = T/2 + math.sqrt(T*T - 4*R)/2
 	min_time = math.floor(low_root + 1)
 	max_time = math.ceil(high_root - 1)
-	win_count_product *= max_time - min_time + 1
-print(f"Part 1: The product of the numbers of ways we can win is: {win_count_product}")
+	return max_time - min_time + 1
+
+def concatenated_race(races: tuple) -> tuple:
+	times, distances = races
+	T = int(''.join(str(t) for t in times))
+	R = int(''.join(str(d) for d in distances))
+	return T, R
+
+def part1(races: tuple) -> int:
+	times, distances = races
+	win_count_product = 1
+	for ways in count_ways_to_win_all(times, distances):
+		win_count_product *= ways
+	return win_count_product
+
+def reference_part1(races: tuple) -> int:
+	times, distances = races
+	win_count_product = 1
+	for race in range(len(times)):
+		win_count_product *= count_ways_to_win_float(times[race], distances[race])
+	return win_count_product
 
 # Part 2: Concatenate the times and distances to produce a single race with huge values. How many
 # ways are there to beat the record? We can use the same solution as above.
-T = int(''.join(re.findall(r'\d+', input_lines[0])))
-R = int(''.join(re.findall(r'\d+', input_lines[1])))
-low_root = T/2 - math.sqrt(T*T - 4*R)/2
-high_root = T/2 + math.sqrt(T*T - 4*R)/2
-min_time = math.floor(low_root + 1)
-max_time = math.ceil(high_root - 1)
-print(f"Part 2: The number of ways we can win is: {max_time - min_time + 1}")
+def part2(races: tuple) -> int:
+	return count_ways_to_win(*concatenated_race(races))
+
+def reference_part2(races: tuple) -> int:
+	return count_ways_to_win_float(*concatenated_race(races))
+
+if __name__ == '__main__':
+	races = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The product of the numbers of ways we can win is: {part1(races)}")
+	print(f"Part 2: The number of ways we can win is: {part2(races)}")
@@ -1,23 +1,15 @@
-import re, sys, math
+import math
 from functools import cmp_to_key
+import puzzle_input
 
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
-
-# Process the input. Each line is one Camel Cards hand and a numerical bid
-input_lines = input_text.split('\n')
-hands = {}
-for line in input_lines:
-	s = line.split(' ')
-	hands[s[0]] = int(s[1])
+# Process the input. Each line is one Camel Cards hand and a numerical bid. The same hand can turn
+# up more than once (with its own bid), so they're kept as a list of (hand, bid) pairs.
+def parse(text) -> list:
+	hands = []
+	for line in puzzle_input.as_view(text).text_lines():
+		s = line.split(' ')
+		hands.append((s[0], int(s[1])))
+	return hands
 
 # Part 1: Sort the hands according to strength. If the rank of a hand is its order in this list,
 # what is the sum of the products of each hand's rank and bid? Our main goal here is to implement
@@ -76,9 +68,46 @@ def compare_hands(hand1: str, hand2: str):
 	else:
 		return compare_hand_values(hand1, hand2)
 
-sorted_hands = sorted(list(hands), key=cmp_to_key(compare_hands))
-total_winnings = sum((h + 1) * hands[sorted_hands[h]] for h in range(len(sorted_hands)))
-print(f"Part 1: The total winnings are: {total_winnings}")
+def total_winnings(hands: list, compare) -> int:
+	sorted_hands = sorted(hands, key=lambda hand_bid: cmp_to_key(compare)(hand_bid[0]))
+	return sum((h + 1) * sorted_hands[h][1] for h in range(len(sorted_hands)))
+
+# That was the original solution, which verify.py checks the one below against
+def reference_part1(hands: list) -> int:
+	return total_winnings(hands, compare_hands)
+
+# The hand type only depends on how many of each card there are, and there are only a handful of
+# ways to split five cards up. Adding up hand.count(card) for every card in the hand gives the sum
+# of the squares of the counts, which happens to be different for every way of splitting up five
+# cards (or fewer, for the jokers below), so it can go straight into a look-up table.
+count_patterns = [(1, 1, 1, 1, 1), (2, 1, 1, 1), (2, 2, 1), (3, 1, 1), (3, 2), (4, 1), (5,)]
+hand_type_table = [None] * 26
+for type_number, pattern in enumerate(count_patterns):
+	hand_type_table[sum(c*c for c in pattern)] = type_number
+
+def hand_type(hand: str) -> int:
+	return hand_type_table[sum(map(hand.count, hand))]
+
+# Comparing hands figures out both hand types all over again for every comparison. Instead, each
+# hand can be boiled down to one number that sorts the same way: the hand type, followed by the
+# value of each card in order, four bits apiece. Then it's an ordinary sort on those numbers, and
+# each hand only gets looked at once.
+card_values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
+
+def hand_key(hand: str, hand_type, values: dict) -> int:
+	key = hand_type(hand)
+	for card in hand:
+		key = (key << 4) | values[card]
+	return key
+
+# Identical hands tie, and the sort is stable, so they keep their input order just like they do in
+# the reference version
+def total_winnings_by_key(hands: list, hand_type, values: dict) -> int:
+	sorted_bids = [bid for _, bid in sorted(hands, key=lambda hand_bid: hand_key(hand_bid[0], hand_type, values))]
+	return sum((h + 1) * sorted_bids[h] for h in range(len(sorted_bids)))
+
+def part1(hands: list) -> int:
+	return total_winnings_by_key(hands, hand_type, card_values)
 
 # Part 2: J cards are now jokers, which act as wild cards for determining the hand type but have
 # lowest possible card values. For the hand type, we can add the joker count to the highest card
@@ -146,6 +175,34 @@ def compare_joker_hands(hand1: str, hand2: str):
 	else:
 		return compare_joker_hand_values(hand1, hand2)
 
-sorted_hands = sorted(list(hands), key=cmp_to_key(compare_joker_hands))
-total_winnings = sum((h + 1) * hands[sorted_hands[h]] for h in range(len(sorted_hands)))
-print(f"Part 2: The total winnings are: {total_winnings}")
+def reference_part2(hands: list) -> int:
+	return total_winnings(hands, compare_joker_hands)
+
+# The table version needs to know the joker count as well as the pattern of the other cards. The
+# jokers go on top of the biggest count, and the table works out ahead of time what every pattern
+# turns into. Taking the jokers' square back out of the sum leaves the other cards' pattern.
+def count_splits(num_cards: int, largest: int) -> list:
+	if num_cards == 0:
+		return [()]
+	return [(c,) + rest for c in range(min(num_cards, largest), 0, -1) for rest in count_splits(num_cards - c, c)]
+
+joker_type_table = [None] * (6 * 32)
+for jokers in range(6):
+	for split in count_splits(5 - jokers, 5):
+		promoted = (split[0] + jokers,) + split[1:] if split else (5,)
+		joker_type_table[32 * jokers + sum(c*c for c in split)] = count_patterns.index(promoted)
+
+def joker_hand_type(hand: str) -> int:
+	jokers = hand.count('J')
+	return joker_type_table[32 * jokers + sum(map(hand.count, hand)) - jokers * jokers]
+
+joker_card_values = card_values | {'J': 1}
+
+def part2(hands: list) -> int:
+	return total_winnings_by_key(hands, joker_hand_type, joker_card_values)
+
+if __name__ == '__main__':
+	hands = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The total winnings are: {part1(hands)}")
+	print(f"Part 2: The total winnings are: {part2(hands)}")
+
@@ -1,61 +1,216 @@
-import re, sys, math
-
-# Read the input
-try:
-	day_num = int(re.findall(r'\d+', __file__)[-1])
-	filename_base = 'Example' if '--example' in sys.argv else 'Input'
-	filename = filename_base + str(day_num) + '.txt'
-	with open(filename, 'rt') as f:
-		input_text = f.read()[:-1]
-except Exception as e:
-	print(f"Error reading input: [{e.__class__.__name__}] {e}")
-	exit()
+import re, math
+import puzzle_input
 
 # Process the input. The first line has a list of left and right instructions on it, while the
-# remaining lines describe a binary tree-like structure.
-input_lines = input_text.split('\n')
-instructions = input_lines[0]
-tree = {}
-for line in input_lines[2:]:
-	nodes = re.findall(r'[A-Z0-9]+', line)
-	tree[nodes[0]] = (nodes[1], nodes[2])
-
-# Part 1: How many steps does it take to get from node AAA to node ZZZ?
-
-step = 0
-node = 'AAA'
-while True:
-	next_instruction = instructions[step % len(instructions)]
-	choice = 0 if next_instruction == 'L' else 1
-	node = tree[node][choice]
-	step += 1
-	if node == 'ZZZ':
-		break
-
-print(f"Part 1: The number of steps needed to reach ZZZ is: {step}")
+# remaining lines describe a binary tree-like structure. It gets compiled into a Network (below)
+# right away so that both parts can share it.
+def parse(text) -> 'Network':
+	input_lines = puzzle_input.as_view(text).text_lines()
+	instructions = input_lines[0]
+	tree = {}
+	for line in input_lines[2:]:
+		nodes = re.findall(r'[A-Z0-9]+', line)
+		tree[nodes[0]] = (nodes[1], nodes[2])
+	return Network(instructions, tree)
+
+# Walking the network one step at a time with string names is slow once the walks get long. The
+# instructions always repeat the same way, so the network gets compiled down to integer node IDs
+# and then walked one whole pass through the instructions at a time. A single run through the
+# instructions from every node at once gives cycle_next, the node each one ends up at after a
+# pass, and z_hits, the (step, node) for every time that pass lands on a node ending in Z. Any walk
+# from the start of the instructions is then made of whole passes plus part of one. For jumping a
+# long way in one go, jumps[k] is where each node ends up after 2^k passes (binary lifting), built
+# as far up as the longest jump so far needs. The original instructions and tree are kept too, for
+# the step-by-step reference versions.
+class Network:
+	def __init__(self, instructions: str, tree: dict):
+		self.instructions = instructions
+		self.tree = tree
+		self.names = list(tree)
+		self.ids = {name: n for n, name in enumerate(self.names)}
+		left = [self.ids[tree[name][0]] for name in self.names]
+		right = [self.ids[tree[name][1]] for name in self.names]
+		self.moves = [left if i == 'L' else right for i in instructions]
+		self.z_nodes = {n for n, name in enumerate(self.names) if name[2] == 'Z'}
+
+		positions = list(range(len(self.names)))
+		self.z_hits = [[] for n in positions]
+		for step, move in enumerate(self.moves, 1):
+			positions = [move[p] for p in positions]
+			for n, p in enumerate(positions):
+				if p in self.z_nodes:
+					self.z_hits[n].append((step, p))
+		self.cycle_next = positions
+		self.jumps = [positions]
+
+	def jump(self, node: int, passes: int) -> int:
+		k = 0
+		while passes:
+			if k == len(self.jumps):
+				last = self.jumps[-1]
+				self.jumps.append([last[n] for n in last])
+			if passes & 1:
+				node = self.jumps[k][node]
+			passes >>= 1
+			k += 1
+		return node
+
+	# Where a walk from the start of the instructions is after any number of steps
+	def walk(self, node: int, steps: int) -> int:
+		node = self.jump(node, steps // len(self.moves))
+		for move in self.moves[:steps % len(self.moves)]:
+			node = move[node]
+		return node
+
+	# The first step that lands on one of the targets (all of the Z nodes if there aren't any
+	# given), or None if the walk never gets there. If a pass starts at the same node twice without
+	# finding a target, it's going around in circles.
+	def first_hit(self, start: int, targets: set = None) -> int:
+		targets = self.z_nodes if targets is None else targets
+		node = start
+		passes = 0
+		seen = set()
+		while node not in seen:
+			seen.add(node)
+			for step, hit in self.z_hits[node]:
+				if hit in targets:
+					return passes * len(self.moves) + step
+			node = self.cycle_next[node]
+			passes += 1
+		return None
+
+	# Everything about when a walk from the start of the instructions is on a Z node. Sooner or
+	# later a pass starts from a node that an earlier pass started from, and from then on the walk
+	# goes around the same loop forever. The Z hits before the loop are tail_hits, and the ones in
+	# the first time around the loop are cycle_hits. Every step after tail_end is on a Z node if it's
+	# a whole number of periods after one of the cycle_hits.
+	def z_schedule(self, start: int) -> tuple:
+		pass_number = {}
+		node = start
+		while node not in pass_number:
+			pass_number[node] = len(pass_number)
+			node = self.cycle_next[node]
+		tail_end = pass_number[node] * len(self.moves)
+		period = (len(pass_number) - pass_number[node]) * len(self.moves)
+		hits = [passes * len(self.moves) + step for node, passes in pass_number.items() for step, _ in self.z_hits[node]]
+		return [t for t in hits if t <= tail_end], [t for t in hits if t > tail_end], tail_end, period
+
+def on_z_node(schedule: tuple, step: int) -> bool:
+	tail_hits, cycle_hits, tail_end, period = schedule
+	if step <= tail_end:
+		return step in tail_hits
+	return (step - tail_end - 1) % period + tail_end + 1 in cycle_hits
+
+# The x that satisfies both x = a (mod m) and x = b (mod n), mod lcm(m, n), or None if there isn't
+# one. The moduli don't have to be coprime.
+def combine_congruences(a: int, m: int, b: int, n: int) -> int:
+	g = math.gcd(m, n)
+	if (b - a) % g != 0:
+		return None
+	k = (b - a) // g * pow(m // g, -1, n // g) % (n // g)
+	return (a + m * k) % (m // g * n)
+
+# Part 1: How many steps does it take to get from node AAA to node ZZZ? Not every example has an
+# AAA and a ZZZ, in which case there's no answer.
+def part1(network: Network) -> int:
+	if 'AAA' not in network.ids or 'ZZZ' not in network.ids:
+		return None
+	return network.first_hit(network.ids['AAA'], {network.ids['ZZZ']})
+
+# This was the original solution, which verify.py checks the compiled one against
+def reference_part1(network: Network) -> int:
+	instructions, tree = network.instructions, network.tree
+	if 'AAA' not in tree or 'ZZZ' not in tree:
+		return None
+	step = 0
+	node = 'AAA'
+	while True:
+		next_instruction = instructions[step % len(instructions)]
+		choice = 0 if next_instruction == 'L' else 1
+		node = tree[node][choice]
+		step += 1
+		if node == 'ZZZ':
+			break
+	return step
 
 # Part 2: Now we have to start at every node whose name ends with A, step through the tree along
 # each path simultaneously, and stop only when every path hits a node whose name ends with Z at the
 # same time. This will probably take a *very* long time, but I'm guessing the paths will cycle
 # through Z nodes at regular intervals. If I can find what those intervals are, I can compute a
-# least common multiple for the solution. 
-nodes = [node for node in tree if node[2] == 'A']
-z_times = [0] * len(nodes)
-step = 0
-while True:
-	next_instruction = instructions[step % len(instructions)]
-	choice = 0 if next_instruction == 'L' else 1;
-	for n in range(len(nodes)):
-		nodes[n] = tree[nodes[n]][choice]
-	step += 1
-	
-	# Turns out that the first cycle is as long as the rest, so I don't even have to wait for the
-	# process to stabilize.
-	for n in range(len(nodes)):
-		if nodes[n][2] == 'Z':
-			z_times[n] = step
-	if all(zt != 0 for zt in z_times):
-		break
-
-needed_steps = math.lcm(*z_times)
-print(f"Part 2: The number of steps needed for all paths to reach a node ending in Z is: {needed_steps}")
+# least common multiple for the solution.
+#
+# An LCM only works if every path is on its Z node exactly once per loop and the loops start right
+# at the beginning, which happens to be true for the real input but not in general. So each path
+# gets a full Z schedule instead. An answer before every path has got into its loop has to be one of
+# the tail hits of the path with the longest tail, so those are checked directly. After that, every
+# path is going around its loop, and each combination of one cycle hit per path is a set of
+# congruences that the Chinese remainder theorem turns into one. The answer is the first step past
+# the tails that fits any of them. If no node ends in A, there's no answer.
+#
+# Only hits that agree modulo the gcd of the two periods can be combined, so the cycle hits get
+# grouped by that first, and incompatible pairs are never tried. The combined residues are all
+# distinct modulo the LCM so far, which keeps the set from ever being bigger than that. Even so, in
+# the worst case (every pair compatible) it's the product of every path's number of cycle hits,
+# which is fine for one hit per loop like the real input but not for paths full of Z nodes.
+def earliest_common_z(schedules: list) -> int:
+	if not schedules:
+		return None
+	longest = max(schedules, key=lambda schedule: schedule[2])
+	for step in sorted(longest[0]):
+		if all(on_z_node(schedule, step) for schedule in schedules):
+			return step
+
+	residues = {0}
+	modulus = 1
+	for _, cycle_hits, _, period in schedules:
+		g = math.gcd(modulus, period)
+		hits_by_class = {}
+		for hit in cycle_hits:
+			hits_by_class.setdefault(hit % g, set()).add(hit % period)
+		residues = {combine_congruences(r, modulus, hit, period) for r in residues for hit in hits_by_class.get(r % g, ())}
+		modulus = math.lcm(modulus, period)
+	if not residues:
+		return None
+	tail_end = longest[2]
+	return min(r + ((tail_end - r) // modulus + 1) * modulus for r in residues)
+
+def part2(network: Network) -> int:
+	starts = [n for n, name in enumerate(network.names) if name[2] == 'A']
+	return earliest_common_z([network.z_schedule(start) for start in starts])
+
+# The original version stopped once every path had been to a Z and took the LCM of the last Z time
+# seen on each, which can overshoot when a short path has been to its Z more than once by then. The
+# reference just does what the puzzle says, which is only practical for small inputs.
+def reference_part2(network: Network) -> int:
+	instructions, tree = network.instructions, network.tree
+	nodes = [node for node in tree if node[2] == 'A']
+	step = 0
+	while True:
+		next_instruction = instructions[step % len(instructions)]
+		choice = 0 if next_instruction == 'L' else 1
+		for n in range(len(nodes)):
+			nodes[n] = tree[nodes[n]][choice]
+		step += 1
+		if all(node[2] == 'Z' for node in nodes):
+			return step
+
+# Neither part needs to know where a walk is after some huge number of steps, but the jump tables
+# are only worth having if they get that right, so verify.py checks walk() against stepping through
+# the instructions one at a time. The step count is a few million and not a multiple of anything
+# in particular, so the check goes through the higher jump tables and a partial pass at the end.
+walk_check_steps = 2_000_003
+
+def walk_check(network: Network) -> str:
+	return network.names[network.walk(0, walk_check_steps)]
+
+def reference_walk_check(network: Network) -> str:
+	instructions, tree = network.instructions, network.tree
+	node = network.names[0]
+	for step in range(walk_check_steps):
+		node = tree[node][0 if instructions[step % len(instructions)] == 'L' else 1]
+	return node
+
+if __name__ == '__main__':
+	network = parse(puzzle_input.load_input(__file__))
+	print(f"Part 1: The number of steps needed to reach ZZZ is: {part1(network)}")
+	print(f"Part 2: The number of steps needed for all paths to reach a node ending in Z is: {part2(network)}")
@@ -0,0 +1,87 @@
+import os, re, json, time, hashlib
+import harness
+
+# Persistent on-disk cache of answers, so that re-running an unchanged day (especially the slow
+# ones like day 21) is instant. The key is a hash of the input file plus the source of the day's
+# script and every module from this repo that it imports, so editing any of them is a cache miss.
+# Each entry is one small JSON file holding the answers and the timings from the run that produced
+# them. Old entries are evicted by age, and then least-recently-used first when the cache grows
+# beyond its size limit.
+cache_dir = os.path.join(harness.repo_dir, '.answer_cache')
+cache_version = 2
+default_max_bytes = 10 * 1024 * 1024
+default_max_age = 90 * 24 * 60 * 60
+
+import_line = re.compile(r'^[ \t]*(?:import[ \t]+([\w \t,.]+)|from[ \t]+(\w+)[ \t]+import)', re.MULTILINE)
+
+# The script plus the repo modules it imports, directly or indirectly
+def solver_sources(script: str) -> list:
+	sources = []
+	pending = [os.path.abspath(script)]
+	while pending:
+		path = pending.pop()
+		if path in sources:
+			continue
+		sources.append(path)
+		with open(path, 'rt') as f:
+			text = f.read()
+		for m in import_line.finditer(text):
+			names = m[1].split(',') if m[1] else [m[2]]
+			for name in names:
+				module = name.strip().split(' ')[0].split('.')[0]
+				module_path = os.path.join(harness.repo_dir, module + '.py')
+				if module and os.path.exists(module_path):
+					pending.append(module_path)
+	return sorted(sources)
+
+def cache_key(script: str, input_path: str) -> str:
+	h = hashlib.sha256()
+	h.update(f"answer-cache-{cache_version}\0".encode())
+	for path in [input_path] + solver_sources(script):
+		with open(path, 'rb') as f:
+			h.update(os.path.basename(path).encode() + b'\0')
+			h.update(hashlib.sha256(f.read()).digest())
+	return h.hexdigest()
+
+def entry_path(key: str) -> str:
+	return os.path.join(cache_dir, key + '.json')
+
+# Returns the cached entry or None. A hit refreshes the entry's modification time, which is what
+# the least-recently-used eviction goes by.
+def lookup(key: str) -> dict:
+	path = entry_path(key)
+	try:
+		with open(path, 'rt') as f:
+			entry = json.load(f)
+		os.utime(path)
+	except (OSError, ValueError):
+		return None
+	return entry if entry.get('version') == cache_version else None
+
+def store(key: str, entry: dict):
+	os.makedirs(cache_dir, exist_ok=True)
+	entry = dict(entry, version=cache_version, created=time.time())
+	tmp_path = entry_path(key) + f".{os.getpid()}.tmp"
+	with open(tmp_path, 'wt') as f:
+		json.dump(entry, f)
+	os.replace(tmp_path, entry_path(key))
+
+def evict(max_bytes: int = default_max_bytes, max_age: float = default_max_age):
+	if not os.path.isdir(cache_dir):
+		return
+	now = time.time()
+	entries = []
+	for name in os.listdir(cache_dir):
+		path = os.path.join(cache_dir, name)
+		stat = os.stat(path)
+		if now - stat.st_mtime > max_age:
+			os.remove(path)
+		else:
+			entries.append((stat.st_mtime, stat.st_size, path))
+
+	total = sum(size for _, size, _ in entries)
+	for mtime, size, path in sorted(entries):
+		if total <= max_bytes:
+			break
+		os.remove(path)
+		total -= size
@@ -0,0 +1,256 @@
+import os, sys, json, math, time, argparse, platform, statistics, multiprocessing
+import harness, generators
+
+# Benchmark suite for all of the days. Parse, part 1, and part 2 are timed separately on both the
+# example and the real input, with several samples per measurement, all in-process through each
+# day's parse/part1/part2 functions. Each run is appended to a JSON
+# history file, and the medians are compared against the stored baseline so that a part getting
+# noticeably slower fails the run.
+#
+#   python benchmark.py                     # Every day, compared against the baseline
+#   python benchmark.py 3-9 --samples 10    # Some days, more samples
+#   python benchmark.py --update-baseline   # Accept the current timings as the new baseline
+#   python benchmark.py --scaled 14 16      # Runtime against input size using generators.py
+#   python benchmark.py --startup 18 24     # Where each day's import time goes, module by module
+#
+# Every normal run also checks how long each day takes to import against its startup budget, so
+# that the short days aren't swamped by import overhead. The budget is the day's STARTUP_BUDGET if
+# it has one, or default_startup_budget.
+history_version = 1
+default_history = os.path.join(harness.repo_dir, 'benchmark_history.json')
+input_kinds = ('example', 'input')
+default_startup_budget = 0.03
+
+def parse_args(argv: list):
+	parser = argparse.ArgumentParser(description='Benchmark the daily puzzle solutions.')
+	parser.add_argument('days', nargs='*', help='days to benchmark, e.g. "1 3 5-8" (default: all)')
+	parser.add_argument('--samples', '-n', type=int, default=None, help='samples per day and input (default: 5, or 1 with --scaled)')
+	parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown as a fraction of the baseline')
+	parser.add_argument('--min-delta', type=float, default=0.005, help='ignore slowdowns smaller than this many seconds')
+	parser.add_argument('--timeout', type=int, default=60, help='per-sample time limit in seconds (0 for none)')
+	parser.add_argument('--jobs', '-j', type=int, default=1, help='number of worker processes (more is faster but noisier)')
+	parser.add_argument('--history', default=default_history, help='JSON history file')
+	parser.add_argument('--update-baseline', action='store_true', help='store this run as the new baseline')
+	parser.add_argument('--scaled', action='store_true', help='time the days with generators on scaled synthetic inputs')
+	parser.add_argument('--factors', type=float, nargs='+', default=generators.default_factors, help='input size factors for --scaled')
+	parser.add_argument('--seed', type=int, default=2023, help='random seed for --scaled inputs')
+	parser.add_argument('--max-exponent', type=float, default=1.5, help='flag phases whose runtime grows faster than size**N')
+	parser.add_argument('--startup', action='store_true', help='only report import time per module for each day')
+	parser.add_argument('--startup-budget', type=float, default=None, help='import time limit in seconds for every day '
+	                    f'(default: each day\'s STARTUP_BUDGET, or {default_startup_budget})')
+	parser.add_argument('--top', type=int, default=5, help='modules to list per day with --startup')
+	args = parser.parse_args(argv)
+	if args.samples is None:
+		args.samples = 1 if args.scaled else 5
+	return args
+
+# Takes all of the samples for one day in a single worker process. The input is parsed once per
+# sample, and the parts are called repeatedly on the parsed data (see harness.sample_day), so
+# everything after the first call runs warm, which is what we want for comparisons.
+def benchmark_day(job: tuple) -> dict:
+	day, samples, timeout = job
+	results = {}
+	for kind in input_kinds:
+		status, phases = harness.sample_day(day, kind == 'example', samples, timeout)
+		results[kind] = {'status': status, 'phases': phases}
+	return {'day': day, 'results': results}
+
+# Times one day on the real input and then on each scaled input in turn. Once a size fails or times
+# out there's no point trying the bigger ones. Phases that finished in every sample still count.
+def benchmark_scaled_day(job: tuple) -> dict:
+	day, factors, samples, timeout, seed = job
+	rows = []
+	for factor in (1,) + tuple(f for f in factors if f != 1):
+		input_dir = harness.repo_dir if factor == 1 else generators.write_scaled_input(day, factor, seed)
+		size = os.path.getsize(harness.input_path(day, False, input_dir))
+		status, phases = harness.sample_day(day, False, samples, timeout, input_dir)
+		medians = {phase: statistics.median(times) for phase, times in phases.items() if len(times) == samples}
+		rows.append({'factor': factor, 'bytes': size, 'status': status, 'phases': medians})
+		if status != 'ok':
+			break
+	return {'day': day, 'scaling': rows}
+
+# The growth exponent between two sizes is the slope on a log-log plot: 1 is linear, 2 is
+# quadratic. Very short phases are mostly noise, so they're skipped.
+def growth_exponents(rows: list, min_time: float = 0.002) -> list:
+	exponents = []
+	for prev, row in zip(rows, rows[1:]):
+		for phase, t in row['phases'].items():
+			t0 = prev['phases'].get(phase)
+			if t0 is not None and t0 >= min_time and row['bytes'] > prev['bytes']:
+				exponents.append((row['factor'], phase, math.log(t / t0) / math.log(row['bytes'] / prev['bytes'])))
+	return exponents
+
+# Returns the phases to flag: any size that timed out or failed (the worst kind of growth), and any
+# phase whose growth exponent is over max_exponent
+def print_scaling_report(scaling: dict, max_exponent: float) -> list:
+	flagged = []
+	print(f"{'Day':>4} {'Factor':>7} {'Bytes':>10} {'Parse (s)':>10} {'Part1 (s)':>10} {'Part2 (s)':>10}")
+	for day, rows in sorted(scaling.items(), key=lambda item: int(item[0])):
+		for row in rows:
+			times = ' '.join(f"{row['phases'][p]:10.4f}" if p in row['phases'] else f"{'-':>10}" for p in ('parse', 'part1', 'part2'))
+			status = '' if row['status'] == 'ok' else f"  ** {row['status']}"
+			print(f"{day:>4} {row['factor']:>7g} {row['bytes']:>10} {times}{status}")
+			if row['status'] != 'ok':
+				flagged.append(f"Day{day} x{row['factor']:g}: {row['status']}")
+		for factor, phase, exponent in growth_exponents(rows):
+			if exponent > max_exponent:
+				flagged.append(f"Day{day} {phase}: runtime grows like size^{exponent:.2f} up to x{factor:g}")
+	return flagged
+
+# Import time of each day against its budget. Returns the import times and a list of
+# human-readable failures.
+def check_startup(days: list, budget: float) -> tuple:
+	times = {}
+	failures = []
+	for day in days:
+		try:
+			times[str(day)], _ = harness.measure_startup(day)
+			day_budget = harness.startup_budget(harness.load_day(day), budget) or default_startup_budget
+		except Exception as e:
+			failures.append(f"Day{day} startup: [{e.__class__.__name__}] {e}")
+			continue
+		if times[str(day)] > day_budget:
+			failures.append(f"Day{day} startup: import takes {times[str(day)]:.4f} s, budget {day_budget:g} s")
+	return times, failures
+
+# The modules with the most import time of their own. Nested imports are indented under the module
+# that imported them, as in the -X importtime output.
+def print_startup_report(days: list, top: int) -> int:
+	print(f"{'Day':>4} {'Import (s)':>11} {'Self (s)':>9}  Module")
+	status = 0
+	for day in days:
+		try:
+			day_time, entries = harness.measure_startup(day)
+		except Exception as e:
+			print(f"{day:>4} ** [{e.__class__.__name__}] {e}")
+			status = 1
+			continue
+		print(f"{day:>4} {day_time:11.4f}")
+		for self_time, cumulative, module in sorted(entries, reverse=True)[:top]:
+			print(f"{'':>4} {cumulative:11.4f} {self_time:9.4f}  {module.strip()}")
+	return status
+
+def load_history(path: str) -> dict:
+	if not os.path.exists(path):
+		return {'version': history_version, 'baseline': {}, 'runs': []}
+	with open(path, 'rt') as f:
+		history = json.load(f)
+	if history.get('version') != history_version:
+		raise ValueError(f"{path} has history version {history.get('version')}, expected {history_version}")
+	return history
+
+def save_history(path: str, history: dict):
+	tmp_path = path + '.tmp'
+	with open(tmp_path, 'wt') as f:
+		json.dump(history, f, indent=1)
+	os.replace(tmp_path, path)
+
+# Compare the medians against the baseline. Only successful measurements are compared (failed ones
+# are reported by failed_measurements instead), and phases with no baseline yet get one. Returns a list of human-readable regression descriptions.
+def check_regressions(run: dict, baseline: dict, threshold: float, min_delta: float, update: bool) -> list:
+	regressions = []
+	for day, day_results in run['results'].items():
+		for kind, kind_results in day_results.items():
+			if kind_results['status'] != 'ok':
+				continue
+			day_baseline = baseline.setdefault(day, {}).setdefault(kind, {})
+			for phase, times in kind_results['phases'].items():
+				median = statistics.median(times)
+				if update or phase not in day_baseline:
+					day_baseline[phase] = median
+					continue
+				base = day_baseline[phase]
+				if median > base * (1 + threshold) and median - base > min_delta:
+					regressions.append(f"Day{day} {kind} {phase}: {median:.4f} s vs. baseline {base:.4f} s "
+					                   f"(+{100 * (median / base - 1):.0f}%)")
+	return regressions
+
+# Measurements that didn't finish (a timeout or an error) have nothing to compare, but a part that
+# has started crashing or got too slow to finish is the worst regression of all
+def failed_measurements(run: dict) -> list:
+	return [f"Day{day} {kind}: {kind_results['status']}" for day, day_results in run['results'].items()
+	        for kind, kind_results in day_results.items() if kind_results['status'] != 'ok']
+
+def print_report(run: dict, baseline: dict):
+	print(f"{'Day':>4} {'Input':<8} {'Phase':<6} {'Median (s)':>11} {'Min (s)':>9} {'Baseline':>9}")
+	for day, day_results in sorted(run['results'].items(), key=lambda item: int(item[0])):
+		for kind, kind_results in day_results.items():
+			for phase, times in kind_results['phases'].items():
+				base = baseline.get(day, {}).get(kind, {}).get(phase)
+				base_text = f"{base:9.4f}" if base is not None else f"{'-':>9}"
+				print(f"{day:>4} {kind:<8} {phase:<6} {statistics.median(times):11.4f} {min(times):9.4f} {base_text}")
+			if kind_results['status'] != 'ok':
+				print(f"{day:>4} {kind:<8} ** {kind_results['status']}")
+
+def main(argv: list) -> int:
+	args = parse_args(argv)
+	try:
+		days = harness.parse_day_list(args.days)
+		history = load_history(args.history)
+	except ValueError as e:
+		print(e)
+		return 2
+
+	if args.startup:
+		return print_startup_report(days, args.top)
+
+	run = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+	       'machine': platform.machine(), 'samples': args.samples, 'results': {}}
+	if args.scaled:
+		return run_scaled(args, days, history, run)
+
+	jobs = [(day, args.samples, args.timeout) for day in days]
+	with multiprocessing.Pool(processes=min(args.jobs, len(jobs)), maxtasksperchild=1) as pool:
+		for r in pool.imap_unordered(benchmark_day, jobs):
+			print(f"Day{r['day']} done", file=sys.stderr)
+			run['results'][str(r['day'])] = r['results']
+
+	run['startup'], startup_failures = check_startup(days, args.startup_budget)
+	regressions = check_regressions(run, history['baseline'], args.threshold, args.min_delta, args.update_baseline)
+	failures = failed_measurements(run)
+	print_report(run, history['baseline'])
+	history['runs'].append(run)
+	save_history(args.history, history)
+
+	status = 0
+	if failures:
+		print(f"\n{len(failures)} measurement(s) failed:")
+		for failure in failures:
+			print('  ' + failure)
+		status = 1
+	if regressions:
+		print(f"\n{len(regressions)} regression(s) beyond {100 * args.threshold:.0f}%:")
+		for regression in regressions:
+			print('  ' + regression)
+		status = 1
+	if startup_failures:
+		print(f"\n{len(startup_failures)} day(s) over their startup budget:")
+		for failure in startup_failures:
+			print('  ' + failure)
+		status = 1
+	return status
+
+def run_scaled(args, days: list, history: dict, run: dict) -> int:
+	days = [day for day in days if day in generators.scaled_generators]
+	run['seed'] = args.seed
+	run['scaling'] = {}
+	jobs = [(day, tuple(args.factors), args.samples, args.timeout, args.seed) for day in days]
+	with multiprocessing.Pool(processes=max(1, min(args.jobs, len(jobs))), maxtasksperchild=1) as pool:
+		for r in pool.imap_unordered(benchmark_scaled_day, jobs):
+			print(f"Day{r['day']} done", file=sys.stderr)
+			run['scaling'][str(r['day'])] = r['scaling']
+
+	flagged = print_scaling_report(run['scaling'], args.max_exponent)
+	history['runs'].append(run)
+	save_history(args.history, history)
+
+	if flagged:
+		print(f"\n{len(flagged)} phase(s) failed or growing faster than size^{args.max_exponent:g}:")
+		for f in flagged:
+			print('  ' + f)
+		return 1
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,554 @@
+import os, sys, math, random, string, argparse
+import harness
+
+# Synthetic puzzle inputs for the grid and graph days, scaled relative to the size of the real
+# input (a factor of 10 means roughly ten times as many cells, lines, or nodes). Every generator takes
+# a seeded random.Random and returns the full text of a valid input file, trailing newline included.
+# The files are written as scaled/x<factor>/Input<day>.txt so that a day can be pointed at one of
+# those directories and still find its input with the usual filename rules.
+#
+#   python generators.py                    # Every generator at 2x, 10x, and 100x
+#   python generators.py 14 17 --factors 4  # Just some days, at 4x
+scaled_dir = os.path.join(harness.repo_dir, 'scaled')
+default_factors = (2, 10, 100)
+
+def real_input_lines(day: int) -> list:
+	with open(os.path.join(harness.repo_dir, f"Input{day}.txt"), 'rt') as f:
+		return f.read()[:-1].split('\n')
+
+# For the grid days the area scales with the factor, so each side scales with its square root
+def scaled_side(side: int, factor: float, minimum: int = 3) -> int:
+	return max(minimum, round(side * math.sqrt(factor)))
+
+def grid_text(grid: list) -> str:
+	return '\n'.join(''.join(row) for row in grid) + '\n'
+
+def random_grid(rng: random.Random, width: int, height: int, chars: str, weights: list) -> list:
+	return [rng.choices(chars, weights, k=width) for y in range(height)]
+
+# Unique random node names of a fixed length. The third character can be kept away from A and Z,
+# since day 8 uses it to find the start and end nodes.
+def unique_names(rng: random.Random, count: int, alphabet: str, min_length: int = 2, avoid_third: str = '') -> list:
+	length = max(min_length, 3 if avoid_third else 2)
+	while len(alphabet) ** length < 2 * count:
+		length += 1
+	names = set()
+	while len(names) < count:
+		name = ''.join(rng.choices(alphabet, k=length))
+		if not avoid_third or name[2] not in avoid_third:
+			names.add(name)
+	names = sorted(names)
+	rng.shuffle(names)
+	return names
+
+# Day 1: calibration lines of letters, digits, and spelled-out digits (which can overlap, as in
+# "twone"). Every line gets at least one real digit, so both parts have an answer for it.
+digit_words = ('zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine')
+
+def day1(rng: random.Random, num_lines: int, max_pieces: int) -> str:
+	lines = []
+	for n in range(num_lines):
+		pieces = [rng.choice(string.digits)]
+		for p in range(rng.randint(0, max_pieces)):
+			r = rng.random()
+			if r < 0.3:
+				pieces.append(rng.choice(digit_words))
+			elif r < 0.45:
+				pieces.append(rng.choice(digit_words)[:-1])
+			elif r < 0.6:
+				pieces.append(rng.choice(string.digits))
+			else:
+				pieces.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 3))))
+		rng.shuffle(pieces)
+		lines.append(''.join(pieces))
+	return '\n'.join(lines) + '\n'
+
+# Day 3: an engine schematic of numbers and symbols in a field of periods
+def day3(rng: random.Random, width: int, height: int) -> str:
+	grid = []
+	for y in range(height):
+		row = []
+		while len(row) < width:
+			r = rng.random()
+			length = rng.randint(1, 3)
+			if r < 0.12 and len(row) + length < width:
+				row.append(rng.choice('123456789'))
+				row.extend(rng.choices(string.digits, k=length - 1))
+				row.append('.')
+			elif r < 0.17:
+				row.append(rng.choice('*#+$/@=%-&'))
+			else:
+				row.append('.')
+		grid.append(row[:width])
+	return grid_text(grid)
+
+def day3_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(3)
+	return day3(rng, scaled_side(len(lines[0]), factor), scaled_side(len(lines), factor))
+
+# Day 4: scratchcards. A card never wins copies of cards past the end of the list.
+def day4(rng: random.Random, num_cards: int, num_winning: int, num_have: int) -> str:
+	lines = []
+	for card in range(num_cards):
+		num_matches = rng.randint(0, min(num_winning, num_have, num_cards - 1 - card))
+		numbers = rng.sample(range(1, 100), num_winning + num_have - num_matches)
+		winning = numbers[:num_winning]
+		have = numbers[num_winning:] + winning[:num_matches]
+		rng.shuffle(have)
+		lines.append(f"Card {card + 1:3}: {' '.join(f'{n:2}' for n in winning)} | {' '.join(f'{n:2}' for n in have)}")
+	return '\n'.join(lines) + '\n'
+
+# Day 5: an almanac where every map shuffles the segments of [0, size) around and leaves larger
+# numbers alone, so each map is one-to-one like the real ones. A segment that doesn't move usually
+# doesn't get a rule.
+almanac_names = ('seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location')
+
+def day5(rng: random.Random, size: int, num_segments: int, num_seed_ranges: int) -> str:
+	seeds = []
+	for n in range(num_seed_ranges):
+		start = rng.randrange(size)
+		seeds.extend((start, rng.randint(1, size - start)))
+	blocks = [f"seeds: {' '.join(map(str, seeds))}"]
+	for n in range(len(almanac_names) - 1):
+		cuts = sorted(rng.sample(range(1, size), min(num_segments, size) - 1))
+		segments = list(zip([0] + cuts, cuts + [size]))
+		order = segments[:]
+		rng.shuffle(order)
+		dest = 0
+		rules = []
+		for start, end in order:
+			if dest != start or rng.random() < 0.2:
+				rules.append(f"{dest} {start} {end - start}")
+			dest += end - start
+		rng.shuffle(rules)
+		blocks.append('\n'.join([f"{almanac_names[n]}-to-{almanac_names[n+1]} map:"] + rules))
+	return '\n\n'.join(blocks) + '\n'
+
+# Day 6: races with records that can always be beaten, including when they're all run together
+def day6(rng: random.Random, num_races: int, max_time: int) -> str:
+	while True:
+		times = [rng.randint(2, max_time) for n in range(num_races)]
+		records = [rng.randint(0, (t*t - 1) // 4) for t in times]
+		T = int(''.join(map(str, times)))
+		R = int(''.join(map(str, records)))
+		if T*T > 4*R:
+			break
+	return f"Time:     {' '.join(f'{t:4}' for t in times)}\nDistance: {' '.join(f'{r:4}' for r in records)}\n"
+
+# Day 7: Camel Cards hands, drawn from a few cards at a time so that every hand type turns up,
+# jokers included. Big inputs are bound to repeat some hands, which the solution has to cope with.
+camel_cards = '23456789TJQKA'
+
+def day7(rng: random.Random, num_hands: int) -> str:
+	lines = []
+	for n in range(num_hands):
+		cards = rng.sample(camel_cards, rng.randint(1, 5))
+		hand = ''.join(rng.choice(cards) for n in range(5))
+		lines.append(f"{hand} {rng.randint(1, 1000)}\n")
+	return ''.join(lines)
+
+# Day 8: a network where each ghost walks a loop of chain positions, with two parallel nodes per
+# position so that the left/right instructions pick a different node without changing the
+# position. Each loop goes through its Z node once, and the loop lengths are distinct primes.
+def day8(rng: random.Random, num_ghosts: int, loop_length: int, num_instructions: int) -> str:
+	primes = [n for n in range(max(loop_length, 5), 10 * loop_length + 20) if all(n % d for d in range(2, math.isqrt(n) + 1))]
+	lengths = rng.sample(primes[:2 * num_ghosts], num_ghosts)
+	alphabet = string.ascii_uppercase + string.digits
+	plain_names = iter(unique_names(rng, 2 * sum(lengths), alphabet, avoid_third='AZ'))
+	ghost_names = [name for name in unique_names(rng, num_ghosts + 2, alphabet) if name[:2] not in ('AA', 'ZZ')]
+	network = {}
+	for g in range(num_ghosts):
+		start = 'AAA' if g == 0 else ghost_names[g][:2] + 'A'
+		end = 'ZZZ' if g == 0 else ghost_names[g][:2] + 'Z'
+		chain = [(next(plain_names), next(plain_names)) for n in range(lengths[g] - 1)]
+		network[start] = chain[0]
+		network[end] = chain[0]
+		for n in range(len(chain)):
+			targets = chain[n + 1] if n + 1 < len(chain) else (end, end)
+			network[chain[n][0]] = targets
+			network[chain[n][1]] = targets[::-1]
+	lines = [f"{node} = ({left}, {right})" for node, (left, right) in network.items()]
+	rng.shuffle(lines)
+	instructions = ''.join(rng.choices('LR', k=num_instructions))
+	return instructions + '\n\n' + '\n'.join(lines) + '\n'
+
+def day8_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(8)
+	num_nodes = len(lines) - 2
+	return day8(rng, 6, max(5, round(factor * num_nodes / 12)), len(lines[0]))
+
+# Day 10: a single pipe loop plus junk pipes. The loop is the outline of a random tree of 3x3
+# blocks, which is always one simple closed loop. The middle cell of every block in the tree is
+# enclosed by the loop, and everything outside the tree is filled with random pipe pieces.
+pipe_chars = {frozenset(((0, -1), (0, 1))): '|', frozenset(((-1, 0), (1, 0))): '-', frozenset(((1, 0), (0, -1))): 'L',
+              frozenset(((-1, 0), (0, -1))): 'J', frozenset(((-1, 0), (0, 1))): '7', frozenset(((1, 0), (0, 1))): 'F'}
+
+def day10(rng: random.Random, block_width: int, block_height: int, tree_fraction: float = 0.6) -> str:
+	# Grow a random tree over the blocks
+	start = (rng.randrange(block_width), rng.randrange(block_height))
+	in_tree = {start}
+	tree_edges = []
+	frontier = [(start, n) for n in ((start[0]+1, start[1]), (start[0]-1, start[1]), (start[0], start[1]+1), (start[0], start[1]-1))]
+	target = max(2, int(tree_fraction * block_width * block_height))
+	while len(in_tree) < target and frontier:
+		a, b = frontier.pop(rng.randrange(len(frontier)))
+		if b in in_tree or not (0 <= b[0] < block_width and 0 <= b[1] < block_height):
+			continue
+		in_tree.add(b)
+		tree_edges.append((a, b))
+		for n in ((b[0]+1, b[1]), (b[0]-1, b[1]), (b[0], b[1]+1), (b[0], b[1]-1)):
+			if n not in in_tree:
+				frontier.append((b, n))
+
+	# Each tree block is a ring of the eight cells around its middle. A tree edge cuts one segment
+	# out of the facing sides of two rings and joins them with two parallel links instead.
+	links = set()
+	for bx, by in in_tree:
+		ring = [(3*bx, 3*by), (3*bx+1, 3*by), (3*bx+2, 3*by), (3*bx+2, 3*by+1),
+		        (3*bx+2, 3*by+2), (3*bx+1, 3*by+2), (3*bx, 3*by+2), (3*bx, 3*by+1)]
+		links.update(frozenset((ring[n], ring[n-1])) for n in range(8))
+	for a, b in tree_edges:
+		(ax, ay), (bx, by) = min(a, b), max(a, b)
+		r = rng.randint(0, 1)
+		if ax != bx:
+			a1, a2 = (3*ax+2, 3*ay+r), (3*ax+2, 3*ay+r+1)
+			b1, b2 = (3*bx, 3*by+r), (3*bx, 3*by+r+1)
+		else:
+			a1, a2 = (3*ax+r, 3*ay+2), (3*ax+r+1, 3*ay+2)
+			b1, b2 = (3*bx+r, 3*by), (3*bx+r+1, 3*by)
+		links.difference_update((frozenset((a1, a2)), frozenset((b1, b2))))
+		links.update((frozenset((a1, b1)), frozenset((a2, b2))))
+
+	width, height = 3 * block_width, 3 * block_height
+	grid = random_grid(rng, width, height, '.|-LJ7F', [4, 1, 1, 1, 1, 1, 1])
+	loop_dirs = {}
+	for link in links:
+		a, b = tuple(link)
+		loop_dirs.setdefault(a, []).append((b[0] - a[0], b[1] - a[1]))
+		loop_dirs.setdefault(b, []).append((a[0] - b[0], a[1] - b[1]))
+	for (x, y), dirs in loop_dirs.items():
+		grid[y][x] = pipe_chars[frozenset(dirs)]
+
+	# Put the start somewhere on the loop and make sure no junk pipes point into it, since day 10
+	# works out the start tile from its neighbours.
+	sx, sy = rng.choice(list(loop_dirs))
+	for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+		nx, ny = sx + dx, sy + dy
+		if (dx, dy) not in loop_dirs[(sx, sy)] and 0 <= nx < width and 0 <= ny < height:
+			if grid[ny][nx] != '.' and (-dx, -dy) in pipe_dirs(grid[ny][nx]):
+				grid[ny][nx] = '.'
+	grid[sy][sx] = 'S'
+	return grid_text(grid)
+
+def pipe_dirs(char: str) -> tuple:
+	for dirs, c in pipe_chars.items():
+		if c == char:
+			return tuple(dirs)
+	return ()
+
+def day10_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(10)
+	return day10(rng, scaled_side(len(lines[0]) // 3, factor, 2), scaled_side(len(lines) // 3, factor, 2))
+
+# Day 11: sparse galaxies with a few completely empty rows and columns
+def day11(rng: random.Random, width: int, height: int, density: float = 0.022, empty_fraction: float = 0.05) -> str:
+	empty_cols = set(rng.sample(range(width), int(empty_fraction * width)))
+	empty_rows = set(rng.sample(range(height), int(empty_fraction * height)))
+	grid = [['#' if x not in empty_cols and y not in empty_rows and rng.random() < density else '.' for x in range(width)]
+	        for y in range(height)]
+	if not any('#' in row for row in grid):
+		grid[0][0] = '#'
+	return grid_text(grid)
+
+def day11_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(11)
+	return day11(rng, scaled_side(len(lines[0]), factor), scaled_side(len(lines), factor))
+
+# Day 12: spring records. Each record is made from a random row of springs, so it always has at
+# least one valid arrangement, and then some of the springs are hidden behind question marks.
+def day12(rng: random.Random, num_records: int, max_length: int, unknown_fraction: float = 0.5) -> str:
+	lines = []
+	for n in range(num_records):
+		length = rng.randint(1, max_length)
+		springs = rng.choices('.#', k=length)
+		springs[rng.randrange(length)] = '#'
+		groups = [len(group) for group in ''.join(springs).split('.') if group]
+		record = ''.join('?' if rng.random() < unknown_fraction else s for s in springs)
+		lines.append(record + ' ' + ','.join(str(g) for g in groups))
+	return '\n'.join(lines) + '\n'
+
+# Day 13: mirror patterns. Each pattern starts out symmetric across both a vertical and a
+# horizontal line, then one cell that only the horizontal line cares about is flipped. That leaves
+# exactly one perfect line for part 1 and exactly one line that's off by a single smudge for
+# part 2. Patterns with accidental extra lines are thrown away.
+def mismatches(masks: list, line: int) -> int:
+	dist = min(line, len(masks) - line)
+	return sum(bin(masks[line - r] ^ masks[line + r - 1]).count('1') for r in range(1, dist + 1))
+
+def mirror_counts(grid: list) -> list:
+	rows = [int(''.join('1' if c == '#' else '0' for c in row), 2) for row in grid]
+	cols = [int(''.join('1' if grid[y][x] == '#' else '0' for y in range(len(grid))), 2) for x in range(len(grid[0]))]
+	return [mismatches(cols, x) for x in range(1, len(cols))] + [mismatches(rows, y) for y in range(1, len(rows))]
+
+def mirror_pattern(rng: random.Random) -> list:
+	while True:
+		width, height = rng.randint(5, 17), rng.randint(5, 17)
+		a, b = rng.randint(1, width - 1), rng.randint(1, height - 1)
+		if 2 * a == width:
+			continue
+		grid = [[rng.choice('.#') for x in range(width)] for y in range(height)]
+		for y in range(height):
+			for x in range(a):
+				if 2*a - 1 - x < width:
+					grid[y][2*a - 1 - x] = grid[y][x]
+		for y in range(b):
+			if 2*b - 1 - y < height:
+				grid[2*b - 1 - y] = list(grid[y])
+
+		paired_cols = range(a - min(a, width - a), a + min(a, width - a))
+		free_cols = [x for x in range(width) if x not in paired_cols]
+		x = rng.choice(free_cols)
+		y = rng.randrange(b - min(b, height - b), b + min(b, height - b))
+		grid[y][x] = '.' if grid[y][x] == '#' else '#'
+
+		counts = mirror_counts(grid)
+		if counts.count(0) == 1 and counts.count(1) == 1:
+			if rng.random() < 0.5:
+				grid = [list(col) for col in zip(*grid)]
+			return grid
+
+def day13(rng: random.Random, num_patterns: int) -> str:
+	return '\n'.join(grid_text(mirror_pattern(rng)) for n in range(num_patterns))
+
+def day13_scaled(rng: random.Random, factor: float) -> str:
+	num_patterns = sum(1 for line in real_input_lines(13) if line == '') + 1
+	return day13(rng, max(1, round(factor * num_patterns)))
+
+# Day 14: round rocks and cube rocks
+def day14(rng: random.Random, width: int, height: int) -> str:
+	return grid_text(random_grid(rng, width, height, '.O#', [64, 20, 16]))
+
+def day14_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(14)
+	return day14(rng, scaled_side(len(lines[0]), factor), scaled_side(len(lines), factor))
+
+# Day 16: mirrors and splitters
+def day16(rng: random.Random, width: int, height: int) -> str:
+	return grid_text(random_grid(rng, width, height, '.|-/\\', [90, 2.5, 2.5, 2.5, 2.5]))
+
+def day16_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(16)
+	return day16(rng, scaled_side(len(lines[0]), factor), scaled_side(len(lines), factor))
+
+# Day 17: heat loss digits
+def day17(rng: random.Random, width: int, height: int) -> str:
+	return grid_text(random_grid(rng, width, height, '123456789', [1, 2, 3, 3, 3, 3, 3, 2, 1]))
+
+def day17_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(17)
+	return day17(rng, scaled_side(len(lines[0]), factor), scaled_side(len(lines), factor))
+
+# Day 20: binary counters like the real input. Each counter is a chain of flip-flops with a
+# conjunction that resets it after a prime number of presses. The counters feed inverters, which
+# feed &lx, which feeds rx.
+def day20(rng: random.Random, num_counters: int, bits: int = 12) -> str:
+	primes = [n for n in range(2**(bits-1) + 1, 2**bits, 2) if all(n % d for d in range(3, math.isqrt(n) + 1, 2))]
+	names = iter(name for name in unique_names(rng, num_counters * (bits + 2) + 2, string.ascii_lowercase)
+	             if name not in ('lx', 'rx'))
+	lines = []
+	heads = []
+	for c in range(num_counters):
+		period = rng.choice(primes)
+		flip_flops = [next(names) for b in range(bits)]
+		conj = next(names)
+		inverter = next(names)
+		heads.append(flip_flops[0])
+		conj_targets = [flip_flops[0]]
+		for b in range(bits):
+			targets = [flip_flops[b + 1]] if b + 1 < bits else []
+			if period & (1 << b):
+				targets.append(conj)
+			elif b > 0:
+				conj_targets.append(flip_flops[b])
+			rng.shuffle(targets)
+			lines.append(f"%{flip_flops[b]} -> {', '.join(targets)}")
+		rng.shuffle(conj_targets)
+		lines.append(f"&{conj} -> {', '.join(conj_targets + [inverter])}")
+		lines.append(f"&{inverter} -> lx")
+	lines.append(f"broadcaster -> {', '.join(heads)}")
+	lines.append('&lx -> rx')
+	rng.shuffle(lines)
+	return '\n'.join(lines) + '\n'
+
+def day20_scaled(rng: random.Random, factor: float) -> str:
+	num_modules = len(real_input_lines(20))
+	return day20(rng, max(1, round(factor * num_modules / 14)))
+
+# Day 21: a garden with the start in the middle and clear border, middle row, and middle column
+def day21(rng: random.Random, half_side: int, rock_density: float = 0.13) -> str:
+	side = 2 * half_side + 1
+	grid = random_grid(rng, side, side, '.#', [1 - rock_density, rock_density])
+	for n in range(side):
+		for x, y in ((n, 0), (n, side - 1), (0, n), (side - 1, n), (n, half_side), (half_side, n)):
+			grid[y][x] = '.'
+	grid[half_side][half_side] = 'S'
+	return grid_text(grid)
+
+def day21_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(21)
+	return day21(rng, scaled_side(len(lines) // 2, factor, 1))
+
+# Day 23: a maze of straight corridors between junctions on an irregular lattice. The real input is
+# a 6x6 lattice (minus two corners that are only bends), and the number of junctions grows with the
+# factor, since part 1 tries every path and would otherwise be timing the generator. Every corridor
+# has slopes at both ends pointing right or down, so the part 1 graph has no loops, and the start
+# and end corridors come in from the top-left and leave from the bottom-right. A few interior
+# corridors are dropped, but every junction keeps at least three exits so none of them turn into
+# corners that could be walked the wrong way.
+def day23(rng: random.Random, target_side: int, lattice_size: int) -> str:
+	spacing = max(4, (target_side - 7) / max(1, lattice_size - 1))
+	coords = [3]
+	for i in range(1, lattice_size):
+		coords.append(max(coords[-1] + 4, 3 + round(spacing * (i + rng.uniform(-0.2, 0.2)))))
+	n = len(coords)
+	side = coords[-1] + 4
+	grid = [['#'] * side for y in range(side)]
+
+	edges = [((i, j), (i + 1, j)) for i in range(n - 1) for j in range(n)] + \
+	        [((i, j), (i, j + 1)) for i in range(n) for j in range(n - 1)]
+	degree = {(i, j): 0 for i in range(n) for j in range(n)}
+	for a, b in edges:
+		degree[a] += 1
+		degree[b] += 1
+	rng.shuffle(edges)
+	kept = []
+	for a, b in edges:
+		if degree[a] == 4 and degree[b] == 4 and rng.random() < 0.3:
+			degree[a] -= 1
+			degree[b] -= 1
+		else:
+			kept.append((a, b))
+
+	for (i, j), (k, l) in kept:
+		x1, y1, x2, y2 = coords[i], coords[j], coords[k], coords[l]
+		for x in range(x1, x2 + 1):
+			for y in range(y1, y2 + 1):
+				grid[y][x] = '.'
+		slope = '>' if y1 == y2 else 'v'
+		dx, dy = (1, 0) if y1 == y2 else (0, 1)
+		grid[y1 + dy][x1 + dx] = slope
+		grid[y2 - dy][x2 - dx] = slope
+
+	first, last = coords[0], coords[-1]
+	for y in range(first + 1):
+		grid[y][1] = '.'
+	grid[first][2] = '>'
+	grid[last][last + 1] = '>'
+	grid[last][last + 2] = '.'
+	for y in range(last, side):
+		grid[y][side - 2] = '.'
+	return grid_text(grid)
+
+def day23_scaled(rng: random.Random, factor: float) -> str:
+	lines = real_input_lines(23)
+	return day23(rng, scaled_side(len(lines), factor), scaled_side(6, factor, minimum=2))
+
+# Day 25: two random 4-edge-connected halves joined by three wires. Each half starts as a clique of
+# five and every new component gets four wires to earlier ones, so the three wires between the
+# halves are the only minimum cut.
+def day25(rng: random.Random, num_nodes: int) -> str:
+	names = unique_names(rng, num_nodes, string.ascii_lowercase, min_length=3)
+	half = max(5, num_nodes // 2)
+	edges = []
+	for nodes in (names[:half], names[half:2*half]):
+		edges.extend((nodes[i], nodes[j]) for i in range(5) for j in range(i + 1, 5))
+		for n in range(5, len(nodes)):
+			edges.extend((nodes[n], other) for other in rng.sample(nodes[:n], 4))
+	for n in range(3):
+		edges.append((rng.choice(names[:half]), rng.choice(names[half:2*half])))
+
+	wires = {}
+	for a, b in edges:
+		if rng.random() < 0.5:
+			a, b = b, a
+		wires.setdefault(a, []).append(b)
+	lines = [f"{node}: {' '.join(others)}" for node, others in wires.items()]
+	rng.shuffle(lines)
+	return '\n'.join(lines) + '\n'
+
+def day25_scaled(rng: random.Random, factor: float) -> str:
+	num_wires = sum(len(line.split(' ')) - 1 for line in real_input_lines(25))
+	return day25(rng, max(10, round(factor * num_wires / 4)))
+
+scaled_generators = {3: day3_scaled, 8: day8_scaled, 10: day10_scaled, 11: day11_scaled, 13: day13_scaled,
+                     14: day14_scaled, 16: day16_scaled, 17: day17_scaled, 20: day20_scaled, 21: day21_scaled,
+                     23: day23_scaled, 25: day25_scaled}
+
+# Small random inputs for verify.py, which checks the fast solutions against the slow reference ones
+# (see harness.day_references). They have to be small enough for the reference code to get through.
+def day1_small(rng: random.Random) -> str:
+	return day1(rng, rng.randint(1, 20), 8)
+
+def day3_small(rng: random.Random) -> str:
+	return day3(rng, rng.randint(1, 30), rng.randint(1, 10))
+
+def day4_small(rng: random.Random) -> str:
+	return day4(rng, rng.randint(1, 30), 5, 8)
+
+def day5_small(rng: random.Random) -> str:
+	return day5(rng, rng.randint(2, 200), rng.randint(1, 8), rng.randint(1, 4))
+
+def day6_small(rng: random.Random) -> str:
+	return day6(rng, rng.randint(1, 3), 99)
+
+def day7_small(rng: random.Random) -> str:
+	return day7(rng, rng.randint(1, 100))
+
+def day8_small(rng: random.Random) -> str:
+	return day8(rng, rng.randint(1, 3), rng.randint(2, 6), rng.randint(1, 10))
+
+def day11_small(rng: random.Random) -> str:
+	return day11(rng, rng.randint(1, 12), rng.randint(1, 12), density=0.2, empty_fraction=0.2)
+
+def day12_small(rng: random.Random) -> str:
+	return day12(rng, rng.randint(1, 10), 14)
+
+def day17_small(rng: random.Random) -> str:
+	return day17(rng, rng.randint(1, 30), rng.randint(1, 30))
+
+small_generators = {1: day1_small, 3: day3_small, 4: day4_small, 5: day5_small, 6: day6_small, 7: day7_small, 8: day8_small, 11: day11_small, 12: day12_small,
+                    17: day17_small}
+
+def scaled_input_dir(factor: float) -> str:
+	return os.path.join(scaled_dir, f"x{factor:g}")
+
+# Writes the scaled input for one day and returns its directory. The seed is mixed with the day and
+# factor so that each file is reproducible on its own.
+def write_scaled_input(day: int, factor: float, seed: int = 2023) -> str:
+	rng = random.Random(f"{seed}-{day}-{factor:g}")
+	text = scaled_generators[day](rng, factor)
+	directory = scaled_input_dir(factor)
+	os.makedirs(directory, exist_ok=True)
+	with open(os.path.join(directory, f"Input{day}.txt"), 'wt') as f:
+		f.write(text)
+	return directory
+
+def main(argv: list) -> int:
+	parser = argparse.ArgumentParser(description='Write scaled synthetic puzzle inputs.')
+	parser.add_argument('days', nargs='*', help='days to generate, e.g. "10 14-17" (default: all with generators)')
+	parser.add_argument('--factors', type=float, nargs='+', default=default_factors, help='size factors relative to the real input')
+	parser.add_argument('--seed', type=int, default=2023, help='random seed')
+	args = parser.parse_args(argv)
+	days = harness.parse_day_list(args.days) if args.days else sorted(scaled_generators)
+	for day in days:
+		if day not in scaled_generators:
+			print(f"Day{day}: no generator")
+			continue
+		for factor in args.factors:
+			directory = write_scaled_input(day, factor, args.seed)
+			size = os.path.getsize(os.path.join(directory, f"Input{day}.txt"))
+			print(f"Day{day} x{factor:g}: {size} bytes")
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,79 @@
+# A compact 2-D grid for the grid days. The whole grid lives in one flat bytearray, with a one-cell
+# border of a sentinel character around the outside. A cell is addressed by a single integer index,
+# so moving is just adding one of the precomputed direction offsets, and the sentinel means a walk
+# can stop when it hits the border instead of checking coordinates on every step. Cells hold byte
+# values (e.g. ord('#')), which is what indexing a bytearray gives back.
+#
+# Index layout for a 3x2 grid with a border (stride 5):
+#
+#    0  1  2  3  4
+#    5 [6  7  8] 9
+#   10 [11 12 13] 14
+#   15 16 17 18 19
+class Grid:
+	def __init__(self, lines: list, border: str = ' '):
+		self.y_size = len(lines)
+		self.x_size = len(lines[0]) if self.y_size > 0 else 0
+		self.stride = self.x_size + 2
+		self.border = ord(border)
+		self.cells = bytearray([self.border]) * (self.stride * (self.y_size + 2))
+		for y in range(self.y_size):
+			start = self.index(0, y)
+			line = lines[y]
+			self.cells[start:start + self.x_size] = line.encode() if isinstance(line, str) else bytes(line)
+
+		self.up = -self.stride
+		self.down = self.stride
+		self.left = -1
+		self.right = 1
+		self.directions = (self.up, self.down, self.left, self.right)
+
+	def index(self, x: int, y: int) -> int:
+		return (y + 1) * self.stride + x + 1
+
+	def coords(self, i: int) -> tuple:
+		y, x = divmod(i, self.stride)
+		return x - 1, y - 1
+
+	def __len__(self) -> int:
+		return len(self.cells)
+
+	def __getitem__(self, i: int) -> int:
+		return self.cells[i]
+
+	def __setitem__(self, i: int, value: int):
+		self.cells[i] = value
+
+	def get(self, x: int, y: int) -> int:
+		return self.cells[self.index(x, y)]
+
+	# Indices of the cells inside the border, row by row
+	def indices(self):
+		for y in range(self.y_size):
+			start = self.index(0, y)
+			yield from range(start, start + self.x_size)
+
+	def find(self, char: str) -> int:
+		return self.cells.index(ord(char), self.stride)
+
+	def neighbours(self, i: int) -> tuple:
+		return (i + self.up, i + self.down, i + self.left, i + self.right)
+
+	# Row and column views share memory with the grid. Views compare equal when their contents do,
+	# which makes row and column comparisons cheap.
+	def row(self, y: int) -> memoryview:
+		start = self.index(0, y)
+		return memoryview(self.cells)[start:start + self.x_size]
+
+	def column(self, x: int) -> memoryview:
+		start = self.index(x, 0)
+		return memoryview(self.cells)[start:start + self.y_size * self.stride:self.stride]
+
+	def copy(self):
+		new = Grid.__new__(Grid)
+		new.__dict__.update(self.__dict__)
+		new.cells = bytearray(self.cells)
+		return new
+
+	def __str__(self) -> str:
+		return '\n'.join(bytes(self.row(y)).decode() for y in range(self.y_size))
@@ -0,0 +1,254 @@
+import io, os, re, sys, time, signal, resource, contextlib, subprocess, tracemalloc, importlib.util
+import puzzle_input
+
+# Shared plumbing for the tools that run the daily puzzles (the all-days runner and friends). Each
+# DayN.py is an importable module with parse(text), part1(data), and part2(data) functions (day 25
+# only has a part 1), plus a main guard that keeps the command line behaviour. The tools import the
+# module, parse the input once, and call the parts on the parsed data, timing each phase on its own.
+repo_dir = os.path.dirname(os.path.abspath(__file__))
+
+def day_script(day: int) -> str:
+	return os.path.join(repo_dir, f"Day{day}.py")
+
+def all_days() -> list[int]:
+	matches = (re.fullmatch(r'Day(\d+)\.py', name) for name in os.listdir(repo_dir))
+	return sorted(int(m[1]) for m in matches if m)
+
+# Day lists are given as numbers and ranges, e.g. "1 3 5-8" or "1,3,5-8". No days means all days.
+def parse_day_list(specs: list) -> list[int]:
+	available = all_days()
+	days = []
+	for spec in specs:
+		for item in filter(None, spec.split(',')):
+			if '-' in item:
+				first, last = (int(n) for n in item.split('-'))
+				days.extend(range(first, last + 1))
+			else:
+				days.append(int(item))
+	if len(days) == 0:
+		return available
+	missing = [d for d in days if d not in available]
+	if missing:
+		raise ValueError(f"No script for day(s): {', '.join(str(d) for d in missing)}")
+	return sorted(set(days))
+
+def input_path(day: int, example: bool = False, input_dir: str = None) -> str:
+	return os.path.join(input_dir or repo_dir, ('Example' if example else 'Input') + f"{day}.txt")
+
+# Day modules are imported by path and cached, so a worker that runs the same day repeatedly only
+# pays for the import once
+day_modules = {}
+
+def load_day(day: int):
+	if day not in day_modules:
+		spec = importlib.util.spec_from_file_location(f"Day{day}", day_script(day))
+		module = importlib.util.module_from_spec(spec)
+		sys.modules[spec.name] = module
+		spec.loader.exec_module(module)
+		day_modules[day] = module
+	return day_modules[day]
+
+# The parts a day actually has, in order
+def day_parts(module) -> list:
+	return [(name, getattr(module, name)) for name in ('part1', 'part2') if hasattr(module, name)]
+
+# A day can keep its old, slow, obviously-correct code for a part around as reference_part1 or
+# reference_part2, for verify.py to check the fast version against. Any other function can be
+# checked the same way by giving it a reference_ twin that takes the same parsed data (e.g. Day 8's
+# walk_check). Returns (name, fast, reference), parts first.
+def day_references(module) -> list:
+	names = [name for name, _ in day_parts(module)]
+	names += sorted(name[len('reference_'):] for name in vars(module) if name.startswith('reference_')
+	                and name[len('reference_'):] not in names)
+	return [(name, getattr(module, name), getattr(module, 'reference_' + name)) for name in names
+	        if hasattr(module, name) and hasattr(module, 'reference_' + name)]
+
+class DayTimeout(Exception):
+	pass
+
+def raise_timeout(signum, frame):
+	raise DayTimeout()
+
+# Resource usage snapshot: wall time, CPU time (user + system), and the peak resident set size so
+# far in MB. Linux reports ru_maxrss in KB; macOS reports it in bytes.
+def usage() -> tuple:
+	ru = resource.getrusage(resource.RUSAGE_SELF)
+	rss_scale = 1 / (1024 * 1024) if sys.platform == 'darwin' else 1 / 1024
+	return time.perf_counter(), ru.ru_utime + ru.ru_stime, ru.ru_maxrss * rss_scale
+
+# Memory tracing (see run_day). Tracing makes everything several times slower, so it's only done
+# when asked for. The numbers are for Python objects only (tracemalloc doesn't see memory that C
+# extensions get straight from the OS), but for these puzzles that's nearly everything.
+class MemoryTracer:
+	def __init__(self):
+		if not tracemalloc.is_tracing():
+			tracemalloc.start()
+
+	# Everything outside the day's own code is left out: the tracer's own snapshots, the harness
+	# around the call, and the frozen import machinery
+	ignored = [tracemalloc.Filter(False, tracemalloc.__file__),
+	           tracemalloc.Filter(False, os.path.join('*', os.path.basename(__file__))),
+	           tracemalloc.Filter(False, '<frozen *>')]
+
+	@classmethod
+	def snapshot(cls):
+		return tracemalloc.take_snapshot().filter_traces(cls.ignored)
+
+	# begin() and finish() go right around the call being measured, so that nothing the harness
+	# allocates for itself lands in between
+	def begin(self):
+		self.start_snapshot = self.snapshot()
+		tracemalloc.reset_peak()
+		self.start_bytes = tracemalloc.get_traced_memory()[0]
+
+	# The peak is how far above the starting point memory went during the phase, in MB. Live blocks
+	# are the allocations the phase made that are still alive at the end (for parse, that's the
+	# parsed data), and the top line is where the most of those bytes were allocated. This is not a
+	# count of every allocation: tracemalloc only sees what's alive when a snapshot is taken, so
+	# blocks created and freed inside the phase don't show up at all. Only the lines that gained
+	# blocks count, since a phase freeing earlier blocks (e.g. ones that were waiting for the
+	# garbage collector) would otherwise make it negative.
+	def finish(self) -> dict:
+		peak = tracemalloc.get_traced_memory()[1]
+		end_snapshot = self.snapshot()
+		stats = end_snapshot.compare_to(self.start_snapshot, 'lineno')
+		top = stats[0] if stats and stats[0].size_diff > 0 else None
+		return {'mem_peak': (peak - self.start_bytes) / (1024 * 1024),
+		        'live_blocks': sum(stat.count_diff for stat in stats if stat.count_diff > 0),
+		        'mem_top': f"{os.path.basename(top.traceback[0].filename)}:{top.traceback[0].lineno}" if top else None}
+
+# Calls func(arg) under a time limit, with anything it prints thrown away. Returns the result and a
+# record of the phase's timings and answer. Peak RSS is a high-water mark, so it includes everything
+# before. With trace_memory, the record also gets the phase's own traced memory (see MemoryTracer).
+def run_phase(name: str, func, arg, timeout: int = 0, trace_memory: bool = False) -> tuple:
+	output = io.StringIO()
+	tracer = MemoryTracer() if trace_memory else None
+	memory = None
+	if timeout > 0:
+		signal.signal(signal.SIGALRM, raise_timeout)
+		signal.alarm(timeout)
+	start = usage()
+	try:
+		with contextlib.redirect_stdout(output):
+			if tracer is not None:
+				tracer.begin()
+				value = func(arg)
+				memory = tracer.finish()
+			else:
+				value = func(arg)
+	finally:
+		end = usage()
+		if timeout > 0:
+			signal.alarm(0)
+	answer = None if name == 'parse' or value is None else str(value)
+	phase = {'name': name, 'wall': end[0] - start[0], 'cpu': end[1] - start[1], 'max_rss': end[2],
+	         'answer': answer}
+	if memory is not None:
+		phase.update(memory)
+	return value, phase
+
+def describe_error(e: Exception, timeout: int) -> tuple:
+	if isinstance(e, DayTimeout):
+		return 'timeout', f"Timed out after {timeout} s"
+	return 'error', f"[{e.__class__.__name__}] {e}"
+
+# Import cost of a day, measured in a fresh interpreter with -X importtime so nothing is cached. Each
+# line of its report is "self | cumulative | module", in microseconds, with the module name indented
+# by how deep in the import chain it is. Returns the day module's own cumulative import time (what
+# the day adds on top of the bare interpreter) and the (self, cumulative, module) entries for all
+# the modules it pulled in, both from the fastest of the samples. Times are in seconds.
+importtime_line = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+def measure_startup(day: int, samples: int = 3) -> tuple:
+	best = None
+	for n in range(samples):
+		proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import Day{day}"], cwd=repo_dir,
+		                      capture_output=True, text=True)
+		if proc.returncode != 0:
+			raise RuntimeError(proc.stderr.strip().split('\n')[-1])
+		entries = []
+		day_time = None
+		after_site = False
+		for m in importtime_line.finditer(proc.stderr):
+			self_time, cumulative = int(m[1]) / 1e6, int(m[2]) / 1e6
+			if after_site:
+				entries.append((self_time, cumulative, m[3] + m[4]))
+			if m[4] == 'site' and not m[3]:
+				after_site = True
+			if m[4] == f"Day{day}":
+				day_time = cumulative
+		if best is None or day_time < best[0]:
+			best = (day_time, entries)
+	return best
+
+# A day can set STARTUP_BUDGET to the most time, in seconds, that importing it may take (see
+# measure_startup). budget overrides that for every day.
+def startup_budget(module, budget: float = None) -> float:
+	return budget if budget is not None else getattr(module, 'STARTUP_BUDGET', None)
+
+# A day can set MEMORY_BUDGET to the most traced memory, in MB, that any one of its phases is
+# allowed to use. budget overrides that for every day.
+def memory_budget(module, budget: float = None) -> float:
+	return budget if budget is not None else getattr(module, 'MEMORY_BUDGET', None)
+
+# Run one day in the current process: parse, then each part on the parsed data. Returns a result
+# dictionary that can be pickled back from a worker process. The time limit applies to each phase
+# separately. input_dir can point at some other copy of InputN.txt (e.g. a scaled one from
+# generators.py). With trace_memory, a phase that goes over the day's memory budget fails the day,
+# though the remaining phases still run so that they get measured too.
+def run_day(day: int, example: bool = False, timeout: int = 0, input_dir: str = None,
+            trace_memory: bool = False, budget: float = None) -> dict:
+	result = {'day': day, 'example': example, 'status': 'ok', 'error': None, 'parts': []}
+	day_start = usage()
+	try:
+		module = load_day(day)
+		budget = memory_budget(module, budget)
+		text = puzzle_input.PuzzleInput(input_path(day, example, input_dir))
+		data, phase = run_phase('parse', module.parse, text, timeout, trace_memory)
+		result['parts'].append(phase)
+		for name, part in day_parts(module):
+			_, phase = run_phase(name, part, data, timeout, trace_memory)
+			result['parts'].append(phase)
+	except Exception as e:
+		result['status'], result['error'] = describe_error(e, timeout)
+	finally:
+		if tracemalloc.is_tracing():
+			tracemalloc.stop()
+
+	if trace_memory and budget is not None:
+		result['budget'] = budget
+		over = [p for p in result['parts'] if p['mem_peak'] > budget]
+		if over and result['status'] == 'ok':
+			result['status'] = 'over budget'
+			result['error'] = ', '.join(f"{p['name']} used {p['mem_peak']:.1f} MB" for p in over) + \
+			                  f" of a {budget:g} MB budget"
+
+	day_end = usage()
+	result['wall'] = day_end[0] - day_start[0]
+	result['cpu'] = day_end[1] - day_start[1]
+	result['max_rss'] = day_end[2]
+	return result
+
+# Repeated wall-clock timings of each phase for the benchmarks. Every sample parses the input again,
+# but the parts all run on the data from the first parse, so they're timed warm and without the
+# parse mixed in. Returns the status and a list of times per phase. A phase that fails or times out
+# stops the sampling, but the phases that finished every sample still count.
+def sample_day(day: int, example: bool = False, samples: int = 1, timeout: int = 0, input_dir: str = None) -> tuple:
+	phases = {}
+	try:
+		module = load_day(day)
+		text = puzzle_input.PuzzleInput(input_path(day, example, input_dir))
+		data = None
+		for n in range(samples):
+			parsed, phase = run_phase('parse', module.parse, text, timeout)
+			phases.setdefault('parse', []).append(phase['wall'])
+			if data is None:
+				data = parsed
+		for name, part in day_parts(module):
+			for n in range(samples):
+				_, phase = run_phase(name, part, data, timeout)
+				phases.setdefault(name, []).append(phase['wall'])
+	except Exception as e:
+		status, _ = describe_error(e, timeout)
+		return status, phases
+	return 'ok', phases
@@ -0,0 +1,106 @@
+import os, sys, time, signal, collections
+import harness, puzzle_input
+
+# Sampling profiler for the daily scripts. Running any day with --profile, e.g.
+#
+#   python Day17.py --profile
+#   python Day17.py --example --profile
+#
+# runs the day phase by phase (parse, part 1, part 2; see harness.py) with a CPU-time timer
+# interrupting it every millisecond or so (the kernel may round that up) and recording the Python
+# call stack. Each section gets a file of collapsed stacks in profiles/, one
+# "outer;inner;innermost count" line per distinct stack, which is the format flamegraph.pl,
+# speedscope, and friends read. A short top-N summary of the busiest functions goes to stderr. The
+# answers aren't printed, since the day's own messages live in its main block, which isn't run.
+#
+# When --profile isn't given, the only cost is puzzle_input checking sys.argv for it.
+profile_dir = os.path.join(harness.repo_dir, 'profiles')
+default_interval = 0.001
+top_n = 10
+
+def frame_label(frame) -> str:
+	code = frame.f_code
+	return f"{os.path.basename(code.co_filename)}:{code.co_qualname}"
+
+class Sampler:
+	def __init__(self, stop_code, interval: float = default_interval):
+		self.stop_code = stop_code
+		self.interval = interval
+		self.stacks = collections.Counter()
+
+	# Walk out from the interrupted frame until we get back to the profiler itself. A signal that
+	# lands outside the section being profiled (e.g. just before the timer is cancelled) never
+	# gets there, and would otherwise record the profiler's own stack, so it's dropped.
+	def sample(self, signum, frame):
+		stack = []
+		while frame is not None and frame.f_code is not self.stop_code:
+			stack.append(frame_label(frame))
+			frame = frame.f_back
+		if frame is not None and stack:
+			self.stacks[';'.join(reversed(stack))] += 1
+
+	def start(self):
+		signal.signal(signal.SIGPROF, self.sample)
+		signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+	def stop(self):
+		signal.setitimer(signal.ITIMER_PROF, 0, 0)
+		signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+def run_section(func, arg):
+	return func(arg)
+
+def write_collapsed(path: str, stacks: collections.Counter):
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, 'wt') as f:
+		for stack, count in sorted(stacks.items()):
+			f.write(f"{stack} {count}\n")
+
+# Self samples are the ones where the function was the innermost frame. Total samples count every
+# stack the function appears in at all (once, even if it's recursive).
+def summarize(stacks: collections.Counter) -> list:
+	self_counts = collections.Counter()
+	total_counts = collections.Counter()
+	for stack, count in stacks.items():
+		frames = stack.split(';')
+		self_counts[frames[-1]] += count
+		for label in set(frames):
+			total_counts[label] += count
+	return [(label, self_counts[label], total_counts[label]) for label, _ in self_counts.most_common(top_n)]
+
+def print_summary(title: str, sampler: Sampler, cpu_time: float, path: str):
+	num_samples = sum(sampler.stacks.values())
+	print(f"Profile {title}: {num_samples} samples over {cpu_time:.3f} s CPU -> "
+	      f"{os.path.relpath(path)}", file=sys.stderr)
+	if num_samples == 0:
+		return
+	print(f"  {'self':>6} {'total':>6}  function", file=sys.stderr)
+	for label, self_count, total_count in summarize(sampler.stacks):
+		print(f"  {100 * self_count / num_samples:5.1f}% {100 * total_count / num_samples:5.1f}%  {label}",
+		      file=sys.stderr)
+
+# Run a whole day under the profiler, one section at a time. The timer is cancelled as soon as a
+# section returns, before any of the bookkeeping.
+def profile_day(day: int, example: bool = False, interval: float = default_interval):
+	module = harness.load_day(day)
+	arg = puzzle_input.PuzzleInput(harness.input_path(day, example))
+	for name, func in [('parse', module.parse)] + harness.day_parts(module):
+		sampler = Sampler(run_section.__code__, interval)
+		start = time.process_time()
+		sampler.start()
+		try:
+			value = run_section(func, arg)
+		finally:
+			sampler.stop()
+			cpu_time = time.process_time() - start
+			out_path = os.path.join(profile_dir, f"Day{day}{'-example' if example else ''}-{name}.collapsed")
+			write_collapsed(out_path, sampler.stacks)
+		if name == 'parse':
+			arg = value
+		print_summary(f"Day{day} {name}", sampler, cpu_time, out_path)
+
+# Called by puzzle_input when a script is run with --profile. The day is run again under the
+# profiler, and then this process exits so the unprofiled copy never carries on.
+def profile_script(script: str):
+	profile_day(puzzle_input.day_number(script), '--example' in sys.argv)
+	sys.exit(0)
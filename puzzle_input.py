@@ -0,0 +1,107 @@
+import os, sys, mmap
+
+# Shared input loading for the daily scripts. Every script used to read its whole input with
+# f.read()[:-1] and then split it, which makes several full copies of the text. Instead, the file is
+# memory-mapped and handed out as views over the raw bytes. Splitting into lines or blank-line
+# separated blocks doesn't copy anything, and text is only decoded when asked for. (The grid days
+# build a grid.Grid from the lines.)
+#
+# The filename rules are the same as before: the day number comes from the script's filename, and
+# the file is ExampleN.txt with --example on the command line or InputN.txt otherwise, read from the
+# working directory.
+# The last run of digits in the filename. This used to be a regex, but importing re costs more than
+# some whole days take to run, and the days that don't use regexes shouldn't have to pay for it.
+def day_number(script: str) -> int:
+	digits = ''.join(c if c.isdigit() else ' ' for c in os.path.basename(script))
+	return int(digits.split()[-1])
+
+def input_filename(script: str, example: bool = None) -> str:
+	if example is None:
+		example = '--example' in sys.argv
+	filename_base = 'Example' if example else 'Input'
+	return filename_base + str(day_number(script)) + '.txt'
+
+# A view of part of the input: a start and end offset into a buffer that supports find() (the mmap
+# itself, or bytes for an empty file).
+class TextView:
+	def __init__(self, buffer, start: int, end: int):
+		self.buffer = buffer
+		self.start = start
+		self.end = end
+
+	def __len__(self) -> int:
+		return self.end - self.start
+
+	def __bytes__(self) -> bytes:
+		return self.buffer[self.start:self.end]
+
+	def __str__(self) -> str:
+		return self.text()
+
+	def view(self) -> memoryview:
+		return memoryview(self.buffer)[self.start:self.end]
+
+	def text(self) -> str:
+		return str(self.view(), 'utf-8')
+
+	def split(self, separator: bytes):
+		start = self.start
+		while True:
+			end = self.buffer.find(separator, start, self.end)
+			if end == -1:
+				yield TextView(self.buffer, start, self.end)
+				return
+			yield TextView(self.buffer, start, end)
+			start = end + len(separator)
+
+	def lines(self):
+		return self.split(b'\n')
+
+	def blocks(self):
+		return self.split(b'\n\n')
+
+	# Decoded lines, one string per line. This is what the scripts usually want, and it costs one
+	# copy of the text instead of the three that read/strip/split made.
+	def text_lines(self) -> list:
+		return [line.text() for line in self.lines()]
+
+# The days' parse() functions take either a loaded input or plain text (str or bytes), so they can
+# be fed from a file, a test string, or a generator. Text gets the same final newline treatment as
+# a file.
+def as_view(text) -> TextView:
+	if isinstance(text, TextView):
+		return text
+	if isinstance(text, str):
+		text = text.encode()
+	text = bytes(text)
+	end = len(text)
+	if end > 0 and text[end - 1] == ord('\n'):
+		end -= 1
+	return TextView(text, 0, end)
+
+class PuzzleInput(TextView):
+	def __init__(self, filename: str):
+		with open(filename, 'rb') as f:
+			if os.fstat(f.fileno()).st_size > 0:
+				buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+			else:
+				buffer = b''
+		# Drop the final newline, like the old f.read()[:-1]
+		end = len(buffer)
+		if end > 0 and buffer[end - 1] == ord('\n'):
+			end -= 1
+		super().__init__(buffer, 0, end)
+		self.filename = filename
+
+# Open the input for the calling script, or report the problem and quit like the scripts always did.
+# Every script comes through here first, so this is also where --profile hands the whole run over to
+# the profiler (see profiler.py).
+def load_input(script: str, example: bool = None) -> PuzzleInput:
+	if '--profile' in sys.argv:
+		import profiler
+		profiler.profile_script(script)
+	try:
+		return PuzzleInput(input_filename(script, example))
+	except Exception as e:
+		print(f"Error reading input: [{e.__class__.__name__}] {e}")
+		exit()
@@ -0,0 +1,104 @@
+import os, sys, argparse, multiprocessing
+import harness, answer_cache
+
+# Runs any subset of the daily puzzles (all of them by default) across a pool of worker processes
+# and reports wall time, CPU time, and peak RSS for each day and each part. Every day gets a fresh
+# worker process so that its peak RSS isn't polluted by whichever day ran before it. Answers are
+# cached (see answer_cache.py), so days whose script and input haven't changed aren't rerun.
+#
+#   python run_days.py                  # Every day on the real input
+#   python run_days.py 1-8 12 --example # Some days on the example input
+#   python run_days.py 17 18 --memory   # Also trace how much memory each part allocates
+def parse_args(argv: list):
+	parser = argparse.ArgumentParser(description='Run the daily puzzle solutions in parallel.')
+	parser.add_argument('days', nargs='*', help='days to run, e.g. "1 3 5-8" (default: all)')
+	parser.add_argument('--example', action='store_true', help='use the ExampleN.txt inputs')
+	parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help='number of worker processes')
+	parser.add_argument('--timeout', type=int, default=0, help='per-phase (parse, part 1, part 2) time limit in seconds (0 for none)')
+	parser.add_argument('--no-cache', action='store_true', help='ignore and don\'t update the answer cache')
+	parser.add_argument('--memory', action='store_true', help='trace Python memory use per part (much slower)')
+	parser.add_argument('--memory-budget', type=float, default=None, help='per-part traced memory limit in MB for every day '
+	                    '(default: each day\'s MEMORY_BUDGET, if it has one); implies --memory')
+	return parser.parse_args(argv)
+
+def run_day_job(job: tuple) -> dict:
+	day, example, timeout, trace_memory, budget = job
+	return harness.run_day(day, example, timeout, trace_memory=trace_memory, budget=budget)
+
+def format_seconds(t: float) -> str:
+	return f"{t:9.3f}"
+
+# With --memory there are extra columns for each part's traced peak (over what was already in use
+# when it started), the number of blocks it left allocated (not a count of every allocation it
+# made), and where most of those came from
+def print_report(results: list):
+	traced = any('mem_peak' in part for r in results for part in r['parts'])
+	memory_header = f" {'Peak (MB)':>10} {'Live blks':>9} {'Top line':<14}" if traced else ''
+	print(f"{'Day':>4} {'Part':<6} {'Wall (s)':>9} {'CPU (s)':>9} {'Peak RSS (MB)':>14}{memory_header}  Answer")
+	for r in results:
+		for part in r['parts']:
+			answer = part['answer'] or ''
+			memory = ''
+			if 'mem_peak' in part:
+				memory = f" {part['mem_peak']:10.2f} {part['live_blocks']:9} {part['mem_top'] or '-':<14}"
+			elif traced:
+				memory = f" {'-':>10} {'-':>9} {'-':<14}"
+			print(f"{r['day']:>4} {part['name']:<6} {format_seconds(part['wall'])} {format_seconds(part['cpu'])} "
+			      f"{part['max_rss']:14.1f}{memory}  {answer}")
+		status = '' if r['status'] == 'ok' else f"  ** {r['error']}"
+		if r.get('cached'):
+			status = '  (cached)'
+		elif r.get('budget') is not None and r['status'] == 'ok':
+			status = f"  (within {r['budget']:g} MB budget)"
+		print(f"{r['day']:>4} {'total':<6} {format_seconds(r['wall'])} {format_seconds(r['cpu'])} "
+		      f"{r['max_rss']:14.1f}{status}")
+
+	# The share of the total CPU time makes it obvious which days are eating the budget
+	total_cpu = sum(r['cpu'] for r in results)
+	print(f"\nTotal CPU time: {total_cpu:.3f} s")
+	for r in sorted(results, key=lambda r: r['cpu'], reverse=True):
+		share = 100 * r['cpu'] / total_cpu if total_cpu > 0 else 0
+		print(f"  Day{r['day']:<3} {share:5.1f}%  {r['cpu']:9.3f} s  {r['status']}")
+
+def main(argv: list) -> int:
+	args = parse_args(argv)
+	try:
+		days = harness.parse_day_list(args.days)
+	except ValueError as e:
+		print(e)
+		return 2
+
+	# Cached days are reported with the timings from the run that produced their answers. Memory
+	# tracing needs a real run, but its results are still good for the cache.
+	trace_memory = args.memory or args.memory_budget is not None
+	jobs = []
+	results = []
+	keys = {}
+	for day in days:
+		input_path = harness.input_path(day, args.example)
+		if not args.no_cache and os.path.exists(input_path):
+			keys[day] = answer_cache.cache_key(harness.day_script(day), input_path)
+			entry = None if trace_memory else answer_cache.lookup(keys[day])
+			if entry is not None:
+				results.append(dict(entry['result'], cached=True))
+				continue
+		jobs.append((day, args.example, args.timeout, trace_memory, args.memory_budget))
+
+	if jobs:
+		with multiprocessing.Pool(processes=min(args.jobs, len(jobs)), maxtasksperchild=1) as pool:
+			for result in pool.imap_unordered(run_day_job, jobs):
+				print(f"Day{result['day']} finished: {result['status']} in {result['wall']:.3f} s", file=sys.stderr)
+				results.append(result)
+				if result['status'] == 'ok' and result['day'] in keys:
+					answers = {part['name']: part['answer'] for part in result['parts'] if part['answer']}
+					answer_cache.store(keys[result['day']], {'day': result['day'], 'example': args.example,
+					                                         'answers': answers, 'result': result})
+	if not args.no_cache:
+		answer_cache.evict()
+
+	results.sort(key=lambda r: r['day'])
+	print_report(results)
+	return 0 if all(r['status'] == 'ok' for r in results) else 1
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
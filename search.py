@@ -0,0 +1,136 @@
+import heapq
+from collections import deque
+
+# Shared graph searches for the days that need them. A search is described by a few functions:
+#
+#   neighbours(state)  yields the states reachable in one step. For the weighted searches it yields
+#                      (state, cost) pairs instead, with non-negative integer or float costs.
+#   is_goal(state)     optional; the weighted searches stop at the first goal state they settle
+#   heuristic(state)   optional; turns Dijkstra into A*. It must never overestimate the remaining cost.
+#   encode(state)      optional; turns a state into the key it's stored under. The default is to use
+#                      the state itself, but packing a tuple into one integer is much cheaper to hash.
+#
+# The distances end up in a visited store keyed by the encoded state. A dict is used unless one is
+# passed in. ArrayStore is an alternative for states that encode to small dense integers (e.g. grid
+# indices from grid.py). Passing in a store is also how the caller gets at all of the distances.
+class ArrayStore:
+	def __init__(self, size: int):
+		self.distances = [None] * size
+
+	def get(self, key: int, default=None):
+		d = self.distances[key]
+		return default if d is None else d
+
+	def __contains__(self, key: int) -> bool:
+		return self.distances[key] is not None
+
+	def __getitem__(self, key: int):
+		d = self.distances[key]
+		if d is None:
+			raise KeyError(key)
+		return d
+
+	def __setitem__(self, key: int, distance):
+		self.distances[key] = distance
+
+	def __len__(self) -> int:
+		return len(self.distances) - self.distances.count(None)
+
+	def keys(self):
+		return (key for key, d in enumerate(self.distances) if d is not None)
+
+	def values(self):
+		return (d for d in self.distances if d is not None)
+
+	def items(self):
+		return ((key, d) for key, d in enumerate(self.distances) if d is not None)
+
+def identity(state):
+	return state
+
+# Breadth-first search for unweighted graphs. Every reachable state's distance (in steps) from the
+# nearest start ends up in the visited store, which is returned.
+def bfs(starts, neighbours, encode=identity, visited=None):
+	visited = {} if visited is None else visited
+	queue = deque()
+	for state in starts:
+		key = encode(state)
+		if key not in visited:
+			visited[key] = 0
+			queue.append((state, 0))
+
+	while queue:
+		state, dist = queue.popleft()
+		dist += 1
+		for next_state in neighbours(state):
+			key = encode(next_state)
+			if key not in visited:
+				visited[key] = dist
+				queue.append((next_state, dist))
+	return visited
+
+# Dijkstra's algorithm on a binary heap, or A* if there's a heuristic. The visited store holds the
+# best known cost to each state. Returns the cost of the first goal state reached, or None if there
+# isn't a goal (or it can't be reached), in which case every reachable state has been settled.
+def dijkstra(starts, neighbours, is_goal=None, heuristic=None, encode=identity, visited=None):
+	visited = {} if visited is None else visited
+	heap = []
+	count = 0
+	for state in starts:
+		visited[encode(state)] = 0
+		heap.append((heuristic(state) if heuristic else 0, count, 0, state))
+		count += 1
+	heapq.heapify(heap)
+
+	# The counter breaks ties so that the states themselves never have to be compared
+	while heap:
+		_, _, dist, state = heapq.heappop(heap)
+		if visited[encode(state)] < dist:
+			continue
+		if is_goal is not None and is_goal(state):
+			return dist
+		for next_state, cost in neighbours(state):
+			next_dist = dist + cost
+			key = encode(next_state)
+			best = visited.get(key)
+			if best is None or next_dist < best:
+				visited[key] = next_dist
+				priority = next_dist + heuristic(next_state) if heuristic else next_dist
+				heapq.heappush(heap, (priority, count, next_dist, next_state))
+				count += 1
+	return None
+
+# Dial's algorithm: Dijkstra with a ring of buckets instead of a heap, for integer costs no bigger
+# than max_cost. Everything waiting in the queue is within max_cost of the current distance, so
+# max_cost + 1 buckets are enough and each one only ever holds a single distance at a time. Pushing
+# and popping are O(1). Same arguments and results as dijkstra().
+def dial(starts, neighbours, max_cost: int, is_goal=None, encode=identity, visited=None):
+	visited = {} if visited is None else visited
+	num_buckets = max_cost + 1
+	buckets = [[] for _ in range(num_buckets)]
+	pending = 0
+	for state in starts:
+		visited[encode(state)] = 0
+		buckets[0].append(state)
+		pending += 1
+
+	dist = 0
+	while pending > 0:
+		bucket = buckets[dist % num_buckets]
+		while bucket:
+			state = bucket.pop()
+			pending -= 1
+			if visited[encode(state)] < dist:
+				continue
+			if is_goal is not None and is_goal(state):
+				return dist
+			for next_state, cost in neighbours(state):
+				next_dist = dist + cost
+				key = encode(next_state)
+				best = visited.get(key)
+				if best is None or next_dist < best:
+					visited[key] = next_dist
+					buckets[next_dist % num_buckets].append(next_state)
+					pending += 1
+		dist += 1
+	return None
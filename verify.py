@@ -0,0 +1,117 @@
+import os, re, sys, glob, random, argparse
+import harness, generators
+
+# Differential checking of the fast solutions against the reference ones. A day opts in by keeping
+# its old code for a part as reference_part1 or reference_part2, or a reference_ version of any
+# other function it wants checked (see harness.day_references). Both versions are run on the same
+# parsed data for every example input and for a batch of small random inputs from generators.py, and
+# any disagreement is reported. Inputs that cause a mismatch are saved to verify_failures/ so they
+# can be rerun by hand. The total time each version took gives the speedup, although on inputs this
+# small it's mostly a sanity check on the direction.
+#
+#   python verify.py                 # Every day that has a reference
+#   python verify.py 12 --random 200 # One day, more random inputs
+#   python verify.py 11 --real       # Include the real input (the reference may be slow)
+failure_dir = os.path.join(harness.repo_dir, 'verify_failures')
+
+def parse_args(argv: list):
+	parser = argparse.ArgumentParser(description='Check the fast solutions against the reference ones.')
+	parser.add_argument('days', nargs='*', help='days to check, e.g. "11 12" (default: all with references)')
+	parser.add_argument('--random', type=int, default=50, help='number of random inputs per day')
+	parser.add_argument('--seed', type=int, default=2023, help='random seed')
+	parser.add_argument('--real', action='store_true', help='also check the real input')
+	parser.add_argument('--timeout', type=int, default=60, help='per-call time limit in seconds (0 for none)')
+	return parser.parse_args(argv)
+
+# Looking at the source saves importing every day (and day 25's graph library) just to find out
+def days_with_references() -> list:
+	days = []
+	for day in harness.all_days():
+		with open(harness.day_script(day), 'rt') as f:
+			if 'def reference_' in f.read():
+				days.append(day)
+	return days
+
+# Every input to check, as (label, text) pairs
+def verify_inputs(day: int, num_random: int, seed: int, real: bool) -> list:
+	inputs = []
+	# Day 8 has Example8a.txt and Example8b.txt as well, but Example1*.txt would be days 10 to 19 too
+	for path in sorted(glob.glob(os.path.join(harness.repo_dir, f"Example{day}*.txt"))):
+		if re.fullmatch(rf'Example{day}[a-z]?\.txt', os.path.basename(path)):
+			with open(path, 'rt') as f:
+				inputs.append((os.path.basename(path), f.read()))
+	if real:
+		with open(harness.input_path(day), 'rt') as f:
+			inputs.append((f"Input{day}.txt", f.read()))
+	if day in generators.small_generators:
+		for n in range(num_random):
+			rng = random.Random(f"{seed}-{day}-{n}")
+			inputs.append((f"random-{seed}-{n}", generators.small_generators[day](rng)))
+	return inputs
+
+def save_failure(day: int, label: str, text: str) -> str:
+	os.makedirs(failure_dir, exist_ok=True)
+	path = os.path.join(failure_dir, f"Day{day}-{label.replace('.txt', '')}.txt")
+	with open(path, 'wt') as f:
+		f.write(text)
+	return path
+
+# Returns one row per part: the number of inputs checked, the mismatches, and the total time for
+# each version. An error or timeout counts as a mismatch, including one while parsing, which counts
+# against every part since none of them gets to run.
+def verify_day(day: int, args) -> list:
+	module = harness.load_day(day)
+	references = harness.day_references(module)
+	rows = {name: {'part': name, 'checked': 0, 'mismatches': [], 'fast': 0.0, 'reference': 0.0} for name, _, _ in references}
+	for label, text in verify_inputs(day, args.random, args.seed, args.real):
+		try:
+			data, _ = harness.run_phase('parse', module.parse, text, args.timeout)
+		except Exception as e:
+			_, error = harness.describe_error(e, args.timeout)
+			path = save_failure(day, label, text)
+			for row in rows.values():
+				row['checked'] += 1
+				row['mismatches'].append(f"{label}: parse {error} ({path})")
+			continue
+		for name, fast, reference in references:
+			row = rows[name]
+			row['checked'] += 1
+			try:
+				fast_value, fast_phase = harness.run_phase(name, fast, data, args.timeout)
+				ref_value, ref_phase = harness.run_phase(name, reference, data, args.timeout)
+			except Exception as e:
+				_, error = harness.describe_error(e, args.timeout)
+				row['mismatches'].append(f"{label}: {error} ({save_failure(day, label, text)})")
+				continue
+			row['fast'] += fast_phase['wall']
+			row['reference'] += ref_phase['wall']
+			if fast_value != ref_value:
+				row['mismatches'].append(f"{label}: got {fast_value}, reference says {ref_value} "
+				                         f"({save_failure(day, label, text)})")
+	return list(rows.values())
+
+def main(argv: list) -> int:
+	args = parse_args(argv)
+	try:
+		days = harness.parse_day_list(args.days) if args.days else days_with_references()
+	except ValueError as e:
+		print(e)
+		return 2
+
+	print(f"{'Day':>4} {'Part':<10} {'Inputs':>7} {'Fast (s)':>9} {'Ref (s)':>9} {'Speedup':>8}  Result")
+	failed = False
+	for day in days:
+		rows = verify_day(day, args)
+		if not rows:
+			print(f"{day:>4} {'-':<10} {'-':>7} {'-':>9} {'-':>9} {'-':>8}  no reference")
+		for row in rows:
+			speedup = f"{row['reference'] / row['fast']:7.1f}x" if row['fast'] > 0 else f"{'-':>8}"
+			result = 'ok' if not row['mismatches'] else f"{len(row['mismatches'])} mismatch(es)"
+			print(f"{day:>4} {row['part']:<10} {row['checked']:>7} {row['fast']:9.4f} {row['reference']:9.4f} {speedup}  {result}")
+			for mismatch in row['mismatches']:
+				print('       ' + mismatch)
+			failed = failed or bool(row['mismatches'])
+	return 1 if failed else 0
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))